@@ -1,9 +1,10 @@
 """Cell dependency graph analysis."""
 
 from dataclasses import dataclass, field
+from typing import Optional
 
 from dasa.notebook.base import NotebookAdapter
-from dasa.analysis.parser import parse_cell
+from dasa.analysis.parser import CellAnalysis, parse_cell
 
 
 @dataclass
@@ -15,6 +16,8 @@ class CellNode:
     upstream: set[int] = field(default_factory=set)
     downstream: set[int] = field(default_factory=set)
     label: str = ""  # Short description from first line of code
+    # Calls into an imported module at top level (os.chdir, pd.set_option ...)
+    effects: bool = False
 
 
 @dataclass
@@ -24,36 +27,58 @@ class DependencyGraph:
 
     def get_upstream(self, cell_index: int) -> list[int]:
         """Get all cells this cell depends on (transitively)."""
-        visited = set()
-        self._walk_upstream(cell_index, visited)
-        visited.discard(cell_index)
-        return sorted(visited)
+        return self._reach(cell_index, upstream=True)
 
     def get_downstream(self, cell_index: int) -> list[int]:
         """Get all cells that depend on this cell (transitively)."""
-        visited = set()
-        self._walk_downstream(cell_index, visited)
+        return self._reach(cell_index, upstream=False)
+
+    def cells_for_variable(self, name: str) -> Optional[list[int]]:
+        """Cells needed to rebuild variable ``name``, in notebook order.
+
+        That is the last cell defining it, every later cell referencing it
+        (in-place mutations such as ``df["x"] = ...`` parse as references),
+        every earlier cell with module-level side effects (``os.chdir``,
+        ``sys.path.append``, ``pd.set_option`` ...), and everything those
+        cells depend on. Returns None if no cell defines ``name``.
+        """
+        definers = [idx for idx, node in self.nodes.items() if name in node.definitions]
+        if not definers:
+            return None
+        last_def = max(definers)
+        needed = {last_def}
+        needed.update(
+            idx for idx, node in self.nodes.items()
+            if idx > last_def and name in node.references
+        )
+        last_needed = max(needed)
+        needed.update(
+            idx for idx, node in self.nodes.items()
+            if node.effects and idx < last_needed
+        )
+        for idx in list(needed):
+            needed.update(self.get_upstream(idx))
+        return sorted(needed)
+
+    def _reach(self, cell_index: int, upstream: bool) -> list[int]:
+        """Collect every cell reachable along one edge direction.
+
+        Iterative worklist: each node and edge is visited once, and deep
+        notebooks cannot hit the interpreter's recursion limit.
+        """
+        visited = {cell_index}
+        pending = [cell_index]
+        while pending:
+            node = self.nodes.get(pending.pop())
+            if node is None:
+                continue
+            for nxt in (node.upstream if upstream else node.downstream):
+                if nxt not in visited:
+                    visited.add(nxt)
+                    pending.append(nxt)
         visited.discard(cell_index)
         return sorted(visited)
 
-    def _walk_upstream(self, cell_index: int, visited: set[int]) -> None:
-        if cell_index in visited:
-            return
-        visited.add(cell_index)
-        node = self.nodes.get(cell_index)
-        if node:
-            for up in node.upstream:
-                self._walk_upstream(up, visited)
-
-    def _walk_downstream(self, cell_index: int, visited: set[int]) -> None:
-        if cell_index in visited:
-            return
-        visited.add(cell_index)
-        node = self.nodes.get(cell_index)
-        if node:
-            for down in node.downstream:
-                self._walk_downstream(down, visited)
-
     def to_dict(self) -> dict:
         return {
             idx: {
@@ -62,22 +87,55 @@ class DependencyGraph:
                 "references": sorted(node.references),
                 "upstream": sorted(node.upstream),
                 "downstream": sorted(node.downstream),
+                "effects": node.effects,
             }
             for idx, node in sorted(self.nodes.items())
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "DependencyGraph":
+        """Rebuild a graph from ``to_dict`` output (keys may be strings after JSON)."""
+        graph = cls()
+        for idx, entry in data.items():
+            index = int(idx)
+            graph.nodes[index] = CellNode(
+                index=index,
+                definitions=set(entry["definitions"]),
+                references=set(entry["references"]),
+                upstream=set(entry["upstream"]),
+                downstream=set(entry["downstream"]),
+                label=entry["label"],
+                effects=entry.get("effects", False),
+            )
+        return graph
+
 
 class DependencyAnalyzer:
     """Build and query cell dependency graph."""
 
-    def build_graph(self, adapter: NotebookAdapter) -> DependencyGraph:
-        """Build dependency graph from notebook cells."""
+    def build_graph(
+        self,
+        adapter: NotebookAdapter,
+        parsed: Optional[dict[int, CellAnalysis]] = None,
+    ) -> DependencyGraph:
+        """Build dependency graph from notebook cells.
+
+        ``parsed`` may hold results from ``parse_cells`` to skip re-parsing.
+        """
         graph = DependencyGraph()
         code_cells = adapter.code_cells
 
         # Parse all cells first
+        analyses: dict[int, CellAnalysis] = {}
+        for cell in code_cells:
+            if parsed is not None and cell.index in parsed:
+                analyses[cell.index] = parsed[cell.index]
+            else:
+                analyses[cell.index] = parse_cell(cell.source)
+        imported = set().union(*(a.imports for a in analyses.values()))
+
         for cell in code_cells:
-            analysis = parse_cell(cell.source)
+            analysis = analyses[cell.index]
             # Get label from first meaningful line
             label = self._get_label(cell.source)
             graph.nodes[cell.index] = CellNode(
@@ -85,6 +143,7 @@ class DependencyAnalyzer:
                 definitions=analysis.definitions,
                 references=analysis.references,
                 label=label,
+                effects=bool(analysis.calls & imported),
             )
 
         # Build dependency edges
@@ -94,8 +153,9 @@ class DependencyAnalyzer:
         for cell in code_cells:
             node = graph.nodes[cell.index]
 
-            # Check references against known definitions
-            for ref in node.references:
+            # Check references against known definitions; names the cell reads
+            # before rebinding (df = df.dropna()) need the earlier definer too
+            for ref in node.references | analyses[cell.index].updates:
                 if ref in var_to_cell:
                     defining_cell = var_to_cell[ref]
                     if defining_cell != cell.index:
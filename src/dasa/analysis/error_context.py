@@ -90,38 +90,59 @@ def _extract_error_line(source: str, traceback: list[str]) -> Optional[dict]:
     return None
 
 
+# Looks up candidate names in one pass over globals() — no per-name round
+# trip, and only class-level attribute checks, so a user object's
+# __getattr__ is never triggered.
+_COLUMNS_CODE = """
+def _dasa_columns(names):
+    import json
+    g = globals()
+    for name in names:
+        obj = g.get(name)
+        if obj is not None and hasattr(type(obj), 'columns'):
+            try:
+                cols = [str(c) for c in obj.columns]
+            except Exception:
+                continue
+            if cols:
+                print(json.dumps(cols))
+                return
+    print('[]')
+
+_dasa_columns({names!r})
+del _dasa_columns
+"""
+
+
 def _get_available_columns(kernel: DasaKernelManager, source: str) -> Optional[list[str]]:
     """Try to get available DataFrame columns from the kernel."""
-    df_refs = re.findall(r'(\w+)\[', source)
+    # First-appearance order, so the lookup is deterministic
+    df_refs = list(dict.fromkeys(re.findall(r'(\w+)\[', source)))
+    if not df_refs:
+        return None
 
-    for var_name in set(df_refs):
-        code = f"""
-try:
-    import json as _j
-    _cols = list({var_name}.columns) if hasattr({var_name}, 'columns') else []
-    print(_j.dumps(_cols))
-except:
-    print('[]')
-"""
-        result = kernel.execute(code, timeout=10)
-        if result.success and result.stdout.strip():
-            try:
-                cols = json.loads(result.stdout.strip())
-                if cols:
-                    return cols
-            except json.JSONDecodeError:
-                pass
+    result = kernel.execute(_COLUMNS_CODE.format(names=df_refs), timeout=10)
+    if result.success and result.stdout.strip():
+        try:
+            cols = json.loads(result.stdout.strip())
+            if cols:
+                return cols
+        except json.JSONDecodeError:
+            pass
     return None
 
 
+# A single expression: nothing is bound in the user's namespace, and
+# IPython's own names (In, Out, exit, ...) are not offered as suggestions.
+_VARIABLES_CODE = (
+    "print(__import__('json').dumps([n for n in globals() if not n.startswith('_')"
+    " and n not in ('In', 'Out', 'get_ipython', 'exit', 'quit')]))"
+)
+
+
 def _get_kernel_variables(kernel: DasaKernelManager) -> Optional[list[str]]:
     """Get defined variable names from the kernel."""
-    code = """
-import json as _j
-_vars = [v for v in dir() if not v.startswith('_')]
-print(_j.dumps(_vars))
-"""
-    result = kernel.execute(code, timeout=10)
+    result = kernel.execute(_VARIABLES_CODE, timeout=10)
     if result.success and result.stdout.strip():
         try:
             return json.loads(result.stdout.strip())
@@ -2,10 +2,13 @@
 
 import ast
 import builtins
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 
 BUILTIN_NAMES = set(dir(builtins))
+_MAGIC_LINE = re.compile(r"^\s*%", re.MULTILINE)
 
 
 @dataclass
@@ -16,10 +19,34 @@ class CellAnalysis:
     imports: set[str] = field(default_factory=set)
     functions: set[str] = field(default_factory=set)
     classes: set[str] = field(default_factory=set)
+    # Names read before the cell (re)binds them: ``df = df.dropna()``, ``x += 1``
+    updates: set[str] = field(default_factory=set)
+    # Root names of top-level bare calls: ``os.chdir(...)`` -> "os"
+    calls: set[str] = field(default_factory=set)
 
 
 def parse_cell(source: str) -> CellAnalysis:
-    """Parse cell source and extract variable definitions and references."""
+    """Parse cell source and extract variable definitions and references.
+
+    Results are memoized by source text, so unchanged cells are not
+    re-parsed within a process (e.g. repeated MCP ``check`` calls). Each
+    call returns fresh sets, safe for the caller to modify.
+    """
+    cached = _parse_cell_cached(source)
+    return CellAnalysis(
+        definitions=set(cached.definitions),
+        references=set(cached.references),
+        imports=set(cached.imports),
+        functions=set(cached.functions),
+        classes=set(cached.classes),
+        updates=set(cached.updates),
+        calls=set(cached.calls),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_cell_cached(source: str) -> CellAnalysis:
+    """Parse cell source; shared by ``parse_cell``, must not be mutated."""
     # Filter out magic commands and shell commands
     lines = []
     for line in source.splitlines():
@@ -38,6 +65,8 @@ def parse_cell(source: str) -> CellAnalysis:
 
     _extract_definitions(tree, analysis)
     _extract_references(tree, analysis)
+    _extract_updates(tree, analysis)
+    _extract_calls(tree, analysis)
 
     # Remove self-defined and imported names from references
     analysis.references -= analysis.definitions
@@ -47,6 +76,63 @@ def parse_cell(source: str) -> CellAnalysis:
     return analysis
 
 
+def parse_cells(cells) -> dict[int, CellAnalysis]:
+    """Parse each cell once, keyed by cell index.
+
+    Lets callers that run several analyses share one AST pass per cell.
+    """
+    return {cell.index: parse_cell(cell.source) for cell in cells}
+
+
+def drop_repeated_imports(cells: list) -> list:
+    """Drop import-only cells whose exact source already ran earlier.
+
+    Replaying ``import pandas as pd`` a second time changes nothing unless
+    something in between touched ``pd``, so a repeat is only dropped when
+    no cell between the two occurrences mentions any name it binds (a
+    plain word match, so ``del pd`` and ``globals()["pd"]`` count too).
+    Star imports and magics (``%reset``, ``%run`` ...) are never dropped
+    and stop earlier imports being reused.
+    """
+    kept = []
+    active: dict[str, re.Pattern] = {}  # import-only source -> its names
+    for cell in cells:
+        if cell.source in active:
+            continue
+        if "import *" in cell.source or _MAGIC_LINE.search(cell.source):
+            active.clear()
+        else:
+            active = {
+                src: names for src, names in active.items()
+                if not names.search(cell.source)
+            }
+        names = _import_only_names(cell.source)
+        if names is not None:
+            active[cell.source] = names
+        kept.append(cell)
+    return kept
+
+
+@lru_cache(maxsize=1024)
+def _import_only_names(source: str) -> "re.Pattern | None":
+    """Pattern matching the names bound by an import-only cell, else None."""
+    try:
+        body = ast.parse(source).body
+    except SyntaxError:
+        return None
+    names = []
+    for node in body:
+        if not isinstance(node, (ast.Import, ast.ImportFrom)):
+            return None
+        for alias in node.names:
+            if alias.name == "*":
+                return None
+            names.append(alias.asname or alias.name.split(".")[0])
+    if not names:
+        return None
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, names)) + r")\b")
+
+
 def _extract_definitions(tree: ast.Module, analysis: CellAnalysis) -> None:
     """Extract all variable definitions from the AST."""
     for node in ast.walk(tree):
@@ -116,6 +202,53 @@ def _extract_references(tree: ast.Module, analysis: CellAnalysis) -> None:
             analysis.references.add(node.id)
 
 
+def _extract_updates(tree: ast.Module, analysis: CellAnalysis) -> None:
+    """Extract names the cell reads before binding them itself.
+
+    Walks top-level statements in order; within one statement reads count
+    as coming first (``df = df.dropna()`` evaluates the right side first).
+    These names still need the value from an earlier cell even though they
+    are also definitions of this one.
+    """
+    bound: set[str] = set()
+    for stmt in tree.body:
+        loads: set[str] = set()
+        # Bound before their uses run: loop/with targets, comprehension variables
+        local: set[str] = set()
+        for node in ast.walk(stmt):
+            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+                loads.add(node.id)
+            elif isinstance(node, ast.AugAssign) and isinstance(node.target, ast.Name):
+                loads.add(node.target.id)
+            elif isinstance(node, (ast.For, ast.AsyncFor)):
+                _collect_names_from_target(node.target, local)
+            elif isinstance(node, (ast.With, ast.AsyncWith)):
+                for item in node.items:
+                    if item.optional_vars:
+                        _collect_names_from_target(item.optional_vars, local)
+            elif isinstance(node, (ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp)):
+                for generator in node.generators:
+                    _collect_names_from_target(generator.target, local)
+        analysis.updates |= loads - local - bound
+
+        stmt_defs = CellAnalysis()
+        _extract_definitions(stmt, stmt_defs)
+        bound |= stmt_defs.definitions
+    analysis.updates &= analysis.definitions
+
+
+def _extract_calls(tree: ast.Module, analysis: CellAnalysis) -> None:
+    """Extract root names of top-level call statements (``pd.set_option(...)``)."""
+    for stmt in tree.body:
+        if not (isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Call)):
+            continue
+        func = stmt.value.func
+        while isinstance(func, ast.Attribute):
+            func = func.value
+        if isinstance(func, ast.Name):
+            analysis.calls.add(func.id)
+
+
 def _collect_names_from_target(target: ast.AST, names: set[str]) -> None:
     """Collect variable names from assignment targets (handles tuple unpacking)."""
     if isinstance(target, ast.Name):
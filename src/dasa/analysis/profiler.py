@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from dasa import jsonio
 from dasa.notebook.kernel import DasaKernelManager
 
 
@@ -65,10 +66,13 @@ class DataFrameProfile:
 
 # Code injected into the kernel to profile a DataFrame
 PROFILE_CODE = '''
-import json as _json
-
 def _dasa_profile(var_name, df):
     """Profile a DataFrame and return JSON."""
+    try:
+        # Faster for wide frames, and writes NaN stats (e.g. std of one row) as null
+        from orjson import dumps as _dumps
+    except ImportError:
+        from json import dumps as _dumps
     result = {
         "name": var_name,
         "shape": list(df.shape),
@@ -108,27 +112,32 @@ def _dasa_profile(var_name, df):
 
         result["columns"].append(col_info)
 
-    print(_json.dumps(result))
+    out = _dumps(result)
+    print(out.decode() if isinstance(out, bytes) else out)
 
 _dasa_profile("{var_name}", {var_name})
 del _dasa_profile
 '''
 
 
+# If the session never imported pandas there can be no DataFrames, so the
+# globals are not walked (and pandas is not imported just to check).
 LIST_DATAFRAMES_CODE = '''
 import json as _json
-import pandas as _pd
+import sys as _sys
 
 _dfs = []
-for _name, _obj in list(globals().items()):
-    if not _name.startswith('_') and isinstance(_obj, _pd.DataFrame):
-        _dfs.append({
-            "name": _name,
-            "shape": list(_obj.shape),
-            "memory_mb": round(_obj.memory_usage(deep=True).sum() / 1024 / 1024, 2),
-        })
-print(_json.dumps(_dfs))
-del _dfs
+_pd = _sys.modules.get("pandas")
+if _pd is not None:
+    for _name, _obj in list(globals().items()):
+        if not _name.startswith('_') and isinstance(_obj, _pd.DataFrame):
+            _dfs.append({
+                "name": _name,
+                "shape": list(_obj.shape),
+                "memory_mb": round(_obj.memory_usage(deep=True).sum() / 1024 / 1024, 2),
+            })
+print(_json.dumps(_dfs, separators=(",", ":")))
+del _dfs, _pd
 '''
 
 
@@ -144,12 +153,16 @@ class Profiler:
         if not result.success:
             return []
         try:
-            return json.loads(result.stdout.strip())
+            return jsonio.loads(result.stdout.strip())
         except json.JSONDecodeError:
             return []
 
     def profile_dataframe(self, var_name: str) -> DataFrameProfile:
         """Profile a DataFrame variable in the kernel."""
+        return self.parse_profile(self.profile_data(var_name))
+
+    def profile_data(self, var_name: str) -> dict:
+        """Run the profiling code and return its raw JSON-compatible output."""
         code = PROFILE_CODE.replace("{var_name}", var_name)
         result = self.kernel.execute(code)
 
@@ -160,13 +173,12 @@ class Profiler:
 
         # Parse JSON from stdout
         try:
-            data = json.loads(result.stdout.strip())
+            return jsonio.loads(result.stdout.strip())
         except json.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse profile output: {e}")
 
-        return self._parse_profile(data)
-
-    def _parse_profile(self, data: dict) -> DataFrameProfile:
+    @staticmethod
+    def parse_profile(data: dict) -> DataFrameProfile:
         """Parse raw profile data into DataFrameProfile."""
         columns = []
         issues = []
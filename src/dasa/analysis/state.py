@@ -4,8 +4,8 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 from dasa.notebook.base import NotebookAdapter
-from dasa.analysis.parser import parse_cell
-from dasa.session.state import StateTracker
+from dasa.analysis.parser import CellAnalysis, parse_cell
+from dasa.session.state import StateTracker, code_hash
 
 
 @dataclass
@@ -39,23 +39,6 @@ class StateAnalysis:
         }
 
 
-def _cell_was_executed(
-    cell,
-    state_tracker: Optional[StateTracker],
-    notebook_path: Optional[str],
-) -> bool:
-    """Check if a cell was executed — via notebook execution_count OR dasa run."""
-    # Check notebook's own execution_count (set by Jupyter/Colab)
-    if cell.execution_count is not None:
-        return True
-    # Check state.json (set by dasa run)
-    if state_tracker and notebook_path:
-        return state_tracker.was_executed_current(
-            notebook_path, cell.index, cell.source
-        )
-    return False
-
-
 class StateAnalyzer:
     """Detect state inconsistencies in notebooks."""
 
@@ -64,6 +47,7 @@ class StateAnalyzer:
         adapter: NotebookAdapter,
         notebook_path: Optional[str] = None,
         state_tracker: Optional[StateTracker] = None,
+        parsed: Optional[dict[int, CellAnalysis]] = None,
     ) -> StateAnalysis:
         """Analyze notebook state consistency.
 
@@ -74,6 +58,8 @@ class StateAnalyzer:
                 execution_count from the notebook file.
             state_tracker: Optional StateTracker instance. If not provided and
                 notebook_path is given, creates a default one (looks in CWD/.dasa/).
+            parsed: Optional pre-parsed cells from ``parse_cells``, so the
+                AST pass can be shared with ``DependencyAnalyzer``.
         """
         issues = []
         defined_vars: dict[str, int] = {}
@@ -85,9 +71,21 @@ class StateAnalyzer:
         if state_tracker is None and notebook_path is not None:
             state_tracker = StateTracker()
 
-        # Track which variables are defined at each point
+        # Snapshot state.json once instead of re-reading it per cell
+        executed_hashes: dict[int, str] = {}
+        if state_tracker and notebook_path:
+            executed_hashes = state_tracker.snapshot(notebook_path)
+
+        # One pass over the cells; issues are kept in per-kind lists so the
+        # report still lists errors, then never-executed, then stale cells
+        never_executed: list[StateIssue] = []
+        stale: list[StateIssue] = []
+        correct_order: list[int] = []
         for cell in code_cells:
-            analysis = parse_cell(cell.source)
+            if parsed is not None and cell.index in parsed:
+                analysis = parsed[cell.index]
+            else:
+                analysis = parse_cell(cell.source)
 
             # Check for undefined references
             for ref in analysis.references:
@@ -103,30 +101,34 @@ class StateAnalyzer:
             for defn in analysis.definitions:
                 defined_vars[defn] = cell.index
 
-        # Check for never-executed cells — consult BOTH sources
-        for cell in code_cells:
-            if not _cell_was_executed(cell, state_tracker, notebook_path):
-                issues.append(StateIssue(
+            if cell.execution_count is not None:
+                correct_order.append(cell.index)
+
+            # A dasa run only counts if the code is unchanged since (hash once)
+            recorded = executed_hashes.get(cell.index)
+            run_current = recorded is not None and recorded == code_hash(cell.source)
+
+            # Never executed — consult BOTH execution_count and state.json
+            if cell.execution_count is None and not run_current:
+                never_executed.append(StateIssue(
                     cell_index=cell.index,
                     severity="warning",
                     message="never executed",
                 ))
 
-        # Check for stale cells (code changed since last dasa run)
-        if state_tracker and notebook_path:
-            for cell in code_cells:
-                # Only flag as stale if the cell WAS executed via dasa but code changed
-                if state_tracker.was_executed(notebook_path, cell.index) and \
-                   state_tracker.is_stale(notebook_path, cell.index, cell.source):
-                    issues.append(StateIssue(
-                        cell_index=cell.index,
-                        severity="warning",
-                        message="stale — code modified since last run",
-                    ))
+            # Stale: executed via dasa but code changed since
+            if recorded is not None and not run_current:
+                stale.append(StateIssue(
+                    cell_index=cell.index,
+                    severity="warning",
+                    message="stale — code modified since last run",
+                ))
+
+        issues.extend(never_executed)
+        issues.extend(stale)
 
         # Check execution order (from notebook execution_count only)
         execution_order = adapter.execution_order
-        correct_order = [c.index for c in code_cells if c.execution_count is not None]
 
         if execution_order and execution_order != correct_order:
             issues.append(StateIssue(
@@ -1,16 +1,16 @@
 """Check command — combined notebook health report."""
 
-import json
-
 import typer
 from rich.console import Console
 
+from dasa.jsonio import print_json
 from dasa.notebook.loader import get_adapter
 from dasa.notebook.kernel import DasaKernelManager
 from dasa.analysis.state import StateAnalyzer
-from dasa.analysis.deps import DependencyAnalyzer
+from dasa.analysis.parser import drop_repeated_imports, parse_cells
+from dasa.session.graphs import GraphCache
 from dasa.session.log import SessionLog
-from dasa.session.state import StateTracker
+from dasa.session.state import StateTracker, code_hash
 
 console = Console()
 
@@ -24,12 +24,14 @@ def check(
     """Check notebook health: state, dependencies, staleness."""
     adapter = get_adapter(notebook)
 
+    # Parse each cell once and share the result between both analyses
+    parsed = parse_cells(adapter.code_cells)
+
     # Run all analyses — pass notebook path so StateAnalyzer can consult state.json
     state_analyzer = StateAnalyzer()
-    state_analysis = state_analyzer.analyze(adapter, notebook_path=notebook)
+    state_analysis = state_analyzer.analyze(adapter, notebook_path=notebook, parsed=parsed)
 
-    dep_analyzer = DependencyAnalyzer()
-    dep_graph = dep_analyzer.build_graph(adapter)
+    dep_graph = GraphCache().get_or_build(notebook, adapter, parsed=parsed)
 
     if fix:
         _auto_fix(notebook, adapter, state_analysis, format)
@@ -47,7 +49,7 @@ def check(
                 "cell": cell,
                 "downstream": dep_graph.get_downstream(cell),
             }
-        console.print(json.dumps(data, indent=2))
+        print_json(data)
         return
 
     # Text output
@@ -75,11 +77,11 @@ def check(
         raise typer.Exit(1)
 
 
-def _should_replay(cell, state_tracker: StateTracker, notebook: str) -> bool:
+def _should_replay(cell, executed_hashes: dict[int, str]) -> bool:
     """Check if a cell should be replayed to restore kernel state."""
     if cell.execution_count is not None:
         return True
-    return state_tracker.was_executed_current(notebook, cell.index, cell.source)
+    return executed_hashes.get(cell.index) == code_hash(cell.source)
 
 
 def _auto_fix(notebook: str, adapter, state_analysis, format: str) -> None:
@@ -88,15 +90,18 @@ def _auto_fix(notebook: str, adapter, state_analysis, format: str) -> None:
 
     # Find fixable cells: never-executed or stale
     tracker = StateTracker()
+    executed_hashes = tracker.snapshot(notebook)
     cells_to_fix = []
     for c in code_cells:
         executed_in_notebook = c.execution_count is not None
-        executed_via_dasa = tracker.was_executed_current(notebook, c.index, c.source)
+        recorded = executed_hashes.get(c.index)
+        current_hash = code_hash(c.source)
+        executed_via_dasa = recorded == current_hash
 
         if not executed_in_notebook and not executed_via_dasa:
             # Never executed anywhere
             cells_to_fix.append(c)
-        elif tracker.was_executed(notebook, c.index) and tracker.is_stale(notebook, c.index, c.source):
+        elif recorded is not None and recorded != current_hash:
             # Executed via dasa but code changed
             cells_to_fix.append(c)
 
@@ -116,14 +121,18 @@ def _auto_fix(notebook: str, adapter, state_analysis, format: str) -> None:
         raise typer.Exit(1)
 
     results = []
+    ok = 0
+    fixed: list[tuple[int, str]] = []
 
     try:
         # Replay all cells in order to build up state
         # Checks BOTH execution_count AND state.json
         first_fix = min(c.index for c in cells_to_fix)
-        for c in code_cells:
-            if c.index < first_fix and _should_replay(c, tracker, notebook):
-                kernel.execute(c.source, timeout=300)
+        replay_cells = drop_repeated_imports([
+            c for c in code_cells
+            if c.index < first_fix and _should_replay(c, executed_hashes)
+        ])
+        kernel.execute_many([c.source for c in replay_cells], timeout=300)
 
         # Execute fixable cells
         for target_cell in cells_to_fix:
@@ -135,7 +144,8 @@ def _auto_fix(notebook: str, adapter, state_analysis, format: str) -> None:
             }
 
             if result.success:
-                tracker.update_cell(notebook, target_cell.index, target_cell.source)
+                ok += 1
+                fixed.append((target_cell.index, target_cell.source))
                 if format != "json":
                     console.print(
                         f"  [green]Cell {target_cell.index}: OK[/green] "
@@ -153,19 +163,21 @@ def _auto_fix(notebook: str, adapter, state_analysis, format: str) -> None:
             results.append(cell_result)
 
     finally:
-        kernel.shutdown()
+        # Persist first: the record must not depend on teardown succeeding
+        try:
+            tracker.update_cells(notebook, fixed)
+        finally:
+            kernel.shutdown()
 
     if format == "json":
-        console.print(json.dumps({"fixed": results}, indent=2))
+        print_json({"fixed": results})
     else:
-        ok = sum(1 for r in results if r["success"])
         console.print(f"\n[bold]Fixed {ok}/{len(results)} cells.[/bold]\n")
 
     log = SessionLog()
-    ok = sum(1 for r in results if r["success"])
     log.append("check", f"Auto-fixed {ok}/{len(results)} cells in {notebook}")
 
-    if any(not r["success"] for r in results):
+    if ok < len(results):
         raise typer.Exit(1)
 
 
@@ -1,11 +1,11 @@
 """Context command — project memory management."""
 
-import json
 from typing import Optional
 
 import typer
 from rich.console import Console
 
+from dasa.jsonio import print_json
 from dasa.session.context import ContextManager
 from dasa.session.log import SessionLog
 from dasa.session.profiles import ProfileCache
@@ -32,12 +32,14 @@ def context(
         ctx_mgr.ensure_session()
         ctx_mgr.update(goal=set_goal, status=set_status, name=set_name)
 
+        entries = []
         if set_goal:
-            session_log.append("user", f"Goal: {set_goal}")
+            entries.append(("user", f"Goal: {set_goal}"))
             console.print(f"[green]Goal set:[/green] {set_goal}")
         if set_status:
-            session_log.append("user", f"Status: {set_status}")
+            entries.append(("user", f"Status: {set_status}"))
             console.print(f"[green]Status set:[/green] {set_status}")
+        session_log.append_many(entries)
         if set_name:
             console.print(f"[green]Name set:[/green] {set_name}")
         return
@@ -91,11 +93,10 @@ def _print_context(ctx, session_log, profile_cache) -> None:
             console.print(f"  - {c}")
 
     # Data profiles
-    profiles = profile_cache.list_profiles()
+    profiles = profile_cache.load_all()
     if profiles:
         console.print(f"\n[bold]Data:[/bold]")
-        for name in profiles:
-            profile = profile_cache.load(name)
+        for name, profile in profiles.items():
             if profile:
                 shape = profile.get("shape", [])
                 shape_str = f"{shape[0]:,} rows x {shape[1]} cols" if len(shape) == 2 else ""
@@ -125,9 +126,7 @@ def _print_context(ctx, session_log, profile_cache) -> None:
 
 def _output_json(ctx, session_log, profile_cache) -> None:
     """Output context as JSON."""
-    profiles = {}
-    for name in profile_cache.list_profiles():
-        profiles[name] = profile_cache.load(name)
+    profiles = profile_cache.load_all()
 
     data = {
         "project": {
@@ -142,4 +141,4 @@ def _output_json(ctx, session_log, profile_cache) -> None:
         "profiles": profiles,
         "recent_log": session_log.read(last_n=20),
     }
-    console.print(json.dumps(data, indent=2, default=str))
+    print_json(data, default=str)
@@ -1,32 +1,37 @@
 """Profile command — data profiling."""
 
-import json
 from typing import Optional
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
+from dasa.jsonio import print_json
 from dasa.notebook.loader import get_adapter
 from dasa.notebook.kernel import DasaKernelManager
+from dasa.analysis.parser import drop_repeated_imports
 from dasa.analysis.profiler import Profiler, profile_csv
+from dasa.session.cache import ResultCache, replay_key
+from dasa.session.graphs import GraphCache
 from dasa.session.log import SessionLog
 from dasa.session.profiles import ProfileCache
-from dasa.session.state import StateTracker
+from dasa.session.state import StateTracker, code_hash
 
 console = Console()
 
 
-def _should_replay(cell, state_tracker: StateTracker, notebook: str) -> bool:
+def _should_replay(cell, executed_hashes: dict[int, str]) -> bool:
     """Check if a cell should be replayed to restore kernel state.
 
     A cell should be replayed if it was executed either:
     - In Jupyter/Colab (execution_count is set in .ipynb), OR
     - Via dasa run (tracked in state.json and code hasn't changed)
+
+    ``executed_hashes`` is a ``StateTracker.snapshot()`` of the notebook.
     """
     if cell.execution_count is not None:
         return True
-    return state_tracker.was_executed_current(notebook, cell.index, cell.source)
+    return executed_hashes.get(cell.index) == code_hash(cell.source)
 
 
 def profile(
@@ -34,12 +39,16 @@ def profile(
     var: Optional[str] = typer.Option(None, "--var", "-v", help="Variable name to profile (omit to list all DataFrames)"),
     file: Optional[str] = typer.Option(None, "--file", help="Profile a CSV file directly (no kernel needed)"),
     format: str = typer.Option("text", "--format", "-f", help="Output format: text, json"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Ignore cached results and re-run the notebook"),
 ) -> None:
     """Profile a DataFrame variable or CSV file.
 
     Without --var: lists all DataFrames in the notebook.
     With --var: profiles that specific variable.
     With --file: profiles a CSV directly (no kernel needed).
+
+    Notebook results are cached in .dasa/cache/ and reused while the
+    replayed cells are unchanged; --no-cache forces a fresh run.
     """
     # CSV file profiling (no kernel needed)
     if file is not None:
@@ -50,7 +59,7 @@ def profile(
             raise typer.Exit(1)
 
         if format == "json":
-            console.print(json.dumps(df_profile.to_dict(), indent=2))
+            print_json(df_profile.to_dict())
         else:
             _print_profile(df_profile)
 
@@ -74,6 +83,38 @@ def profile(
     adapter = get_adapter(notebook)
     state_tracker = StateTracker()
 
+    # Cells to replay — checks BOTH notebook execution_count AND state.json
+    executed_hashes = state_tracker.snapshot(notebook)
+    replay_cells = [c for c in adapter.code_cells if _should_replay(c, executed_hashes)]
+
+    # Profiling one variable only needs the cells it depends on
+    full_replay = None  # set when replay_cells is a slice of it
+    if var is not None and var.isidentifier():
+        needed = GraphCache().get_or_build(notebook, adapter).cells_for_variable(var)
+        if needed is not None:
+            needed_set = set(needed)
+            sliced = [c for c in replay_cells if c.index in needed_set]
+            if len(sliced) < len(replay_cells):
+                full_replay = drop_repeated_imports(replay_cells)
+                replay_cells = sliced
+    replay_cells = drop_repeated_imports(replay_cells)
+
+    # Results depend only on the replayed cells (and --var): reuse them while unchanged
+    result_cache = ResultCache()
+    fingerprint = [(c.index, c.source) for c in replay_cells]
+    if var is None:
+        cache_kind, cache_key = "dataframes", replay_key(notebook, fingerprint)
+    else:
+        # The profiled name is folded in as a pseudo-cell after the replayed ones
+        cache_kind, cache_key = "profile", replay_key(notebook, fingerprint + [(-1, var)])
+    cached = None if no_cache else result_cache.load(cache_kind, cache_key)
+    if cached is not None:
+        if var is None:
+            _report_dataframes(notebook, cached, format)
+        else:
+            _report_profile(var, Profiler.parse_profile(cached), format)
+        return
+
     # Start kernel and replay executed cells
     kernel = DasaKernelManager()
     try:
@@ -85,75 +126,97 @@ def profile(
 
     try:
         # Replay previously-executed cells to restore state
-        # Checks BOTH notebook execution_count AND state.json
-        for cell in adapter.code_cells:
-            if _should_replay(cell, state_tracker, notebook):
-                result = kernel.execute(cell.source, timeout=60)
-                if not result.success:
-                    console.print(
-                        f"[yellow]Warning: Cell {cell.index} failed during replay: "
-                        f"{result.error_type}: {result.error}[/yellow]"
-                    )
+        replay_failed = False
+        replayed = kernel.execute_many([c.source for c in replay_cells], timeout=60)
+        if full_replay is not None and not all(r.success for r in replayed):
+            # The slice missed something the variable needs: start clean and
+            # replay everything rather than profile a half-built namespace
+            kernel.restart()
+            replay_cells = full_replay
+            replayed = kernel.execute_many([c.source for c in replay_cells], timeout=60)
+            replay_failed = True  # result no longer matches the cache key
+        for cell, result in zip(replay_cells, replayed):
+            if not result.success:
+                replay_failed = True
+                console.print(
+                    f"[yellow]Warning: Cell {cell.index} failed during replay: "
+                    f"{result.error_type}: {result.error}[/yellow]"
+                )
 
         profiler = Profiler(kernel)
 
         if var is None:
             # Auto-discovery: list all DataFrames
             dataframes = profiler.list_dataframes()
-            if not dataframes:
-                console.print("[yellow]No DataFrames found in the notebook kernel.[/yellow]")
-                return
-
-            if format == "json":
-                console.print(json.dumps(dataframes, indent=2))
-            else:
-                console.print(f"\n[bold]DataFrames in {notebook}:[/bold]\n")
-                table = Table()
-                table.add_column("Variable", style="cyan")
-                table.add_column("Shape", style="green")
-                table.add_column("Memory", style="white")
-                for df_info in dataframes:
-                    shape_str = f"{df_info['shape'][0]:,} x {df_info['shape'][1]}"
-                    mem_str = f"{df_info['memory_mb']:.1f} MB"
-                    table.add_row(df_info["name"], shape_str, mem_str)
-                console.print(table)
-                console.print(
-                    "\n[dim]Use --var <name> to profile a specific DataFrame[/dim]\n"
-                )
-
-            log = SessionLog()
-            names = ", ".join(d["name"] for d in dataframes)
-            log.append("profile", f"Listed {len(dataframes)} DataFrames in {notebook}: {names}")
+            # A failed replay may be transient (missing file, network) — don't pin it
+            if not replay_failed:
+                result_cache.save(cache_kind, cache_key, dataframes)
+            _report_dataframes(notebook, dataframes, format)
             return
 
         # Profile a specific variable
         try:
-            df_profile = profiler.profile_dataframe(var)
+            data = profiler.profile_data(var)
         except RuntimeError as e:
             console.print(f"[red]Error: {e}[/red]")
             raise typer.Exit(1)
 
-        # Output
-        if format == "json":
-            console.print(json.dumps(df_profile.to_dict(), indent=2))
-        else:
-            _print_profile(df_profile)
+        df_profile = Profiler.parse_profile(data)
+        if not replay_failed:
+            result_cache.save(cache_kind, cache_key, data)
+        _report_profile(var, df_profile, format)
 
-        # Auto-cache profile
-        cache = ProfileCache()
-        cache.save(var, df_profile.to_dict())
+    finally:
+        kernel.shutdown()
 
-        # Auto-log
-        log = SessionLog()
-        issues_str = ", ".join(df_profile.issues[:3]) if df_profile.issues else "none"
-        log.append(
-            "profile",
-            f"Profiled {var}. {df_profile.shape[0]:,} rows x {df_profile.shape[1]} cols. "
-            f"Issues: {issues_str}",
+
+def _report_profile(var: str, df_profile, format: str) -> None:
+    """Print a variable's profile, cache it in .dasa/profiles/ and log it."""
+    if format == "json":
+        print_json(df_profile.to_dict())
+    else:
+        _print_profile(df_profile)
+
+    # Auto-cache profile
+    cache = ProfileCache()
+    cache.save(var, df_profile.to_dict())
+
+    # Auto-log
+    log = SessionLog()
+    issues_str = ", ".join(df_profile.issues[:3]) if df_profile.issues else "none"
+    log.append(
+        "profile",
+        f"Profiled {var}. {df_profile.shape[0]:,} rows x {df_profile.shape[1]} cols. "
+        f"Issues: {issues_str}",
+    )
+
+
+def _report_dataframes(notebook: str, dataframes: list[dict], format: str) -> None:
+    """Print the DataFrame listing and log it."""
+    if not dataframes:
+        console.print("[yellow]No DataFrames found in the notebook kernel.[/yellow]")
+        return
+
+    if format == "json":
+        print_json(dataframes)
+    else:
+        console.print(f"\n[bold]DataFrames in {notebook}:[/bold]\n")
+        table = Table()
+        table.add_column("Variable", style="cyan")
+        table.add_column("Shape", style="green")
+        table.add_column("Memory", style="white")
+        for df_info in dataframes:
+            shape_str = f"{df_info['shape'][0]:,} x {df_info['shape'][1]}"
+            mem_str = f"{df_info['memory_mb']:.1f} MB"
+            table.add_row(df_info["name"], shape_str, mem_str)
+        console.print(table)
+        console.print(
+            "\n[dim]Use --var <name> to profile a specific DataFrame[/dim]\n"
         )
 
-    finally:
-        kernel.shutdown()
+    log = SessionLog()
+    names = ", ".join(d["name"] for d in dataframes)
+    log.append("profile", f"Listed {len(dataframes)} DataFrames in {notebook}: {names}")
 
 
 def _print_profile(profile) -> None:
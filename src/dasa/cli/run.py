@@ -1,30 +1,37 @@
 """Run command — cell execution with rich error context."""
 
-import json
+import sys
+from bisect import bisect_left, bisect_right
 
 import typer
 from rich.console import Console
+from rich.markup import escape
 
+from dasa.jsonio import print_json
 from dasa.notebook.loader import get_adapter
 from dasa.notebook.kernel import DasaKernelManager
 from dasa.analysis.error_context import build_error_context
-from dasa.analysis.deps import DependencyAnalyzer
+from dasa.analysis.parser import drop_repeated_imports
+from dasa.session.checkpoints import CheckpointStore
+from dasa.session.graphs import GraphCache
 from dasa.session.log import SessionLog
-from dasa.session.state import StateTracker
+from dasa.session.state import StateTracker, code_hash
 
 console = Console()
 
 
-def _should_replay(cell, state_tracker: StateTracker, notebook: str) -> bool:
+def _should_replay(cell, executed_hashes: dict[int, str]) -> bool:
     """Check if a cell should be replayed to restore kernel state.
 
     A cell should be replayed if it was executed either:
     - In Jupyter/Colab (execution_count is set in .ipynb), OR
     - Via dasa run (tracked in state.json and code hasn't changed)
+
+    ``executed_hashes`` is a ``StateTracker.snapshot()`` of the notebook.
     """
     if cell.execution_count is not None:
         return True
-    return state_tracker.was_executed_current(notebook, cell.index, cell.source)
+    return executed_hashes.get(cell.index) == code_hash(cell.source)
 
 
 def run(
@@ -35,6 +42,10 @@ def run(
     all_cells: bool = typer.Option(False, "--all", help="Run all cells"),
     stale: bool = typer.Option(False, "--stale", help="Run only stale cells"),
     stream: bool = typer.Option(False, "--stream", "-s", help="Stream output live as cells execute"),
+    checkpoint: bool = typer.Option(
+        False, "--checkpoint",
+        help="Restore prior-cell state from a saved checkpoint instead of replaying (needs dill)",
+    ),
     timeout: int = typer.Option(300, "--timeout", "-t", help="Timeout per cell in seconds"),
     format: str = typer.Option("text", "--format", "-f", help="Output format: text, json"),
 ) -> None:
@@ -49,13 +60,15 @@ def run(
         console.print("[yellow]No cells to run.[/yellow]")
         return
 
-    # Build dependency info
-    dep_analyzer = DependencyAnalyzer()
-    dep_graph = dep_analyzer.build_graph(adapter)
+    # Build dependency info — reused from .dasa/graphs/ while the file is unchanged
+    dep_graph = GraphCache().get_or_build(notebook, adapter)
 
     state_tracker = StateTracker()
     log = SessionLog()
-    results = []
+    # Per-cell records are only needed for JSON output
+    json_records: list[dict] | None = [] if format == "json" else None
+    any_failed = False
+    executed: list[tuple[int, str]] = []
 
     kernel = DasaKernelManager()
     try:
@@ -69,24 +82,33 @@ def run(
         # Replay cells before the first target cell to restore state
         # Checks BOTH notebook execution_count AND state.json
         first_target = min(c.index for c in cells_to_run)
-        for c in code_cells:
-            if c.index < first_target and _should_replay(c, state_tracker, notebook):
-                kernel.execute(c.source, timeout=timeout)
+        executed_hashes = state_tracker.snapshot(notebook)
+        replay_cells = drop_repeated_imports([
+            c for c in code_cells
+            if c.index < first_target and _should_replay(c, executed_hashes)
+        ])
+        if checkpoint and replay_cells:
+            _restore_or_replay(kernel, notebook, replay_cells, timeout, format)
+        else:
+            kernel.execute_many([c.source for c in replay_cells], timeout=timeout)
 
         # Execute target cells
         for target_cell in cells_to_run:
             if stream and format != "json":
                 console.print(f"[bold]--- Cell {target_cell.index} ---[/bold]")
                 gen = kernel.execute_streaming(target_cell.source, timeout=timeout)
+                # Raw cell output bypasses Rich: no markup parsing or re-render
+                # per chunk, one write + flush per kernel message
+                sinks = {"stdout": sys.stdout, "stderr": sys.stderr}
                 try:
                     while True:
                         stream_type, text = next(gen)
-                        if stream_type == "stdout":
-                            console.print(text, end="", highlight=False)
-                        elif stream_type == "stderr":
-                            console.print(f"[dim]{text}[/dim]", end="", highlight=False)
+                        sink = sinks.get(stream_type)
+                        if sink is not None:
+                            sink.write(text)
+                            sink.flush()
                         elif stream_type == "error":
-                            console.print(f"[red]{text}[/red]")
+                            console.print(f"[red]{escape(text)}[/red]")
                 except StopIteration as e:
                     result = e.value
                 console.print()  # newline after streaming
@@ -98,35 +120,40 @@ def run(
                 "success": result.success,
                 "execution_time": result.execution_time,
             }
+            any_failed |= not result.success
 
             if result.success:
-                cell_result["stdout"] = result.stdout
-                if result.result:
-                    cell_result["result"] = result.result
-
                 # Check for stale downstream cells
                 downstream = dep_graph.get_downstream(target_cell.index)
-                if downstream:
-                    cell_result["stale_downstream"] = downstream
 
-                # Update state tracking
-                state_tracker.update_cell(notebook, target_cell.index, target_cell.source)
+                if json_records is not None:
+                    cell_result["stdout"] = result.stdout
+                    if result.result:
+                        cell_result["result"] = result.result
+                    if downstream:
+                        cell_result["stale_downstream"] = downstream
+
+                # Update state tracking (written once, after the run)
+                executed.append((target_cell.index, target_cell.source))
 
                 if format != "json":
-                    console.print(
+                    # Build the whole report first so Rich renders it once
+                    lines = [
                         f"[green]Running Cell {target_cell.index}... OK[/green] "
                         f"({result.execution_time:.1f}s)"
-                    )
-                    if result.stdout.strip():
-                        console.print(f"\nOutput:\n  {result.stdout.strip()}")
+                    ]
+                    stdout = result.stdout.strip()
+                    if stdout:
+                        lines.append(f"\nOutput:\n  {escape(stdout)}")
                     if downstream:
                         ds_str = ", ".join(f"Cell {d}" for d in downstream)
-                        console.print(
+                        lines.append(
                             f"\n[yellow]! Downstream cells may be stale: {ds_str}[/yellow]"
                         )
-                        console.print(
+                        lines.append(
                             f"  Run `dasa run {notebook} --from {downstream[0]}` to update"
                         )
+                    console.print("\n".join(lines))
 
                 log.append("run", f"Cell {target_cell.index} executed (success, {result.execution_time:.1f}s)")
 
@@ -142,68 +169,100 @@ def run(
                 cell_result["error"] = error_ctx
 
                 if format != "json":
-                    console.print(
+                    lines = [
                         f"[red]Running Cell {target_cell.index}... FAILED[/red] "
-                        f"({result.execution_time:.1f}s)"
-                    )
-                    console.print(
-                        f"\n[red]Error: {result.error_type}: {result.error}[/red]"
-                    )
+                        f"({result.execution_time:.1f}s)",
+                        f"\n[red]Error: {result.error_type}: {escape(str(result.error))}[/red]",
+                    ]
                     if error_ctx.get("error_line"):
                         line_info = error_ctx["error_line"]
-                        console.print(
-                            f"  Line {line_info['line_number']}: {line_info['content']}"
+                        lines.append(
+                            f"  Line {line_info['line_number']}: {escape(line_info['content'])}"
                         )
                     if error_ctx.get("available_columns"):
                         cols = ", ".join(error_ctx["available_columns"])
-                        console.print(f"\nAvailable columns: {cols}")
+                        lines.append(f"\nAvailable columns: {escape(cols)}")
                     if error_ctx.get("available_variables"):
                         # Show first 20 variables
                         vars_list = error_ctx["available_variables"][:20]
                         vars_str = ", ".join(vars_list)
-                        console.print(f"\nAvailable variables: {vars_str}")
+                        lines.append(f"\nAvailable variables: {vars_str}")
                     if error_ctx.get("suggestion"):
-                        console.print(f"[cyan]Suggestion: {error_ctx['suggestion']}[/cyan]")
+                        lines.append(f"[cyan]Suggestion: {escape(error_ctx['suggestion'])}[/cyan]")
+                    console.print("\n".join(lines))
 
                 log.append(
                     "run",
                     f"Cell {target_cell.index} failed: {result.error_type}: {result.error}",
                 )
 
-            results.append(cell_result)
-            console.print()
+            if json_records is not None:
+                json_records.append(cell_result)
+            else:
+                console.print()
 
-        if format == "json":
-            console.print(json.dumps(results, indent=2))
+        if json_records is not None:
+            print_json(json_records)
 
     finally:
-        kernel.shutdown()
+        # Persist first: the record must not depend on teardown succeeding
+        try:
+            state_tracker.update_cells(notebook, executed)
+        finally:
+            kernel.shutdown()
 
     # Exit with error if any cell failed
-    if any(not r["success"] for r in results):
+    if any_failed:
         raise typer.Exit(1)
 
 
+def _restore_or_replay(kernel, notebook: str, replay_cells, timeout: int, format: str) -> None:
+    """Restore replay state from a checkpoint, or replay and save one."""
+    store = CheckpointStore()
+    key = CheckpointStore.key_for(notebook, [(c.index, c.source) for c in replay_cells])
+
+    if store.exists(key):
+        restored = kernel.execute(store.load_code(key), timeout=timeout)
+        if restored.success:
+            return
+        # Unreadable checkpoint (e.g. dill missing) — fall back to replaying
+
+    kernel.execute_many([c.source for c in replay_cells], timeout=timeout)
+
+    saved = kernel.execute(store.save_code(key), timeout=timeout)
+    if saved.success:
+        store.prune()
+    elif format != "json":
+        console.print(
+            f"[dim]Checkpoint not saved: {saved.error_type}: {escape(str(saved.error))}[/dim]"
+        )
+
+
 def _resolve_cells(code_cells, cell, from_cell, to_cell, all_cells, stale_only, notebook):
     """Determine which cells to execute."""
+    # code_cells is in notebook order, so indices are sorted and range
+    # selections are a bisect + slice rather than a scan
+    indices = [c.index for c in code_cells]
+
     if cell is not None:
-        matches = [c for c in code_cells if c.index == cell]
-        if not matches:
-            total = max((c.index for c in code_cells), default=0)
-            console.print(
-                f"[red]Error: Cell {cell} not found "
-                f"(notebook has cells 0-{total})[/red]"
-            )
-        return matches
+        pos = bisect_left(indices, cell)
+        if pos < len(indices) and indices[pos] == cell:
+            return [code_cells[pos]]
+        total = indices[-1] if indices else 0
+        console.print(
+            f"[red]Error: Cell {cell} not found "
+            f"(notebook has cells 0-{total})[/red]"
+        )
+        return []
 
     if all_cells:
         return code_cells
 
     if from_cell is not None:
-        return [c for c in code_cells if c.index >= from_cell]
+        return code_cells[bisect_left(indices, from_cell):]
 
     if to_cell is not None:
-        return [c for c in code_cells if c.index <= to_cell]
+        return code_cells[:bisect_right(indices, to_cell)]
 
     if stale_only:
         tracker = StateTracker()
@@ -211,7 +270,8 @@ def _resolve_cells(code_cells, cell, from_cell, to_cell, all_cells, stale_only,
             notebook,
             [(c.index, c.source) for c in code_cells],
         )
-        return [c for c in code_cells if c.index in stale_indices]
+        by_index = dict(zip(indices, code_cells))
+        return [by_index[i] for i in stale_indices]
 
     # Default: run all cells
     return code_cells
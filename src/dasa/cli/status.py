@@ -7,10 +7,25 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from dasa.jsonio import print_json
 from dasa.session.jobs import JobManager
 
 console = Console()
 
+# Pre-rendered status cells, e.g. "[yellow]RUNNING[/yellow]"
+_STATUS_MARKUP = {
+    status: f"[{color}]{status.upper()}[/{color}]"
+    for status, color in (("running", "yellow"), ("completed", "green"), ("failed", "red"))
+}
+
+
+def _status_markup(status: str) -> str:
+    """Return Rich markup for a job status."""
+    markup = _STATUS_MARKUP.get(status)
+    if markup is None:
+        markup = f"[white]{status.upper()}[/white]"
+    return markup
+
 
 def status(
     job_id: Optional[str] = typer.Argument(None, help="Job ID to check (omit for all jobs)"),
@@ -26,12 +41,12 @@ def status(
             raise typer.Exit(1)
 
         # Check if process is actually still running
-        if job.status == "running" and not mgr.is_running(job_id):
+        if job.status == "running" and not mgr.process_alive(job):
             job = mgr.update_job(job_id, status="failed", error="Process terminated unexpectedly")
 
         if format == "json":
             from dataclasses import asdict
-            console.print(json.dumps(asdict(job), indent=2))
+            print_json(asdict(job))
         else:
             _print_job(job)
     else:
@@ -40,25 +55,26 @@ def status(
             console.print("[dim]No jobs found.[/dim]")
             return
 
-        # Update status of running jobs
-        for job in jobs:
-            if job.status == "running" and not mgr.is_running(job.id):
-                mgr.update_job(job.id, status="failed", error="Process terminated unexpectedly")
+        # Update status of running jobs — only these need a process probe
+        for i, job in enumerate(jobs):
+            if job.status == "running" and not mgr.process_alive(job):
+                updated = mgr.update_job(job.id, status="failed", error="Process terminated unexpectedly")
+                if updated is not None:
+                    jobs[i] = updated
 
         if format == "json":
             from dataclasses import asdict
-            console.print(json.dumps([asdict(j) for j in jobs], indent=2))
+            print_json([asdict(j) for j in jobs])
         else:
             _print_job_table(jobs)
 
 
 def _print_job(job) -> None:
     """Print a single job's details."""
-    status_color = {"running": "yellow", "completed": "green", "failed": "red"}.get(job.status, "white")
     console.print(f"[bold]Job {job.id}[/bold]")
     console.print(f"  Notebook: {job.notebook}")
     console.print(f"  Cell: {job.cell}")
-    console.print(f"  Status: [{status_color}]{job.status.upper()}[/{status_color}]")
+    console.print(f"  Status: {_status_markup(job.status)}")
     console.print(f"  Started: {job.started_at}")
     if job.completed_at:
         console.print(f"  Completed: {job.completed_at}")
@@ -78,12 +94,11 @@ def _print_job_table(jobs) -> None:
     table.add_column("Started")
 
     for job in jobs:
-        status_color = {"running": "yellow", "completed": "green", "failed": "red"}.get(job.status, "white")
         table.add_row(
             job.id,
             job.notebook,
             str(job.cell),
-            f"[{status_color}]{job.status.upper()}[/{status_color}]",
+            _status_markup(job.status),
             job.started_at,
         )
     console.print(table)
@@ -0,0 +1,70 @@
+"""JSON encode/decode helpers — use orjson when installed, stdlib json otherwise."""
+
+import json
+import sys
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup, not a hard dependency
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str.
+
+    Accepts the ``NaN``/``Infinity`` literals stdlib ``json.dumps`` writes
+    by default. Raises ``json.JSONDecodeError`` (orjson's error subclasses
+    it) on bad input.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # orjson rejects NaN/Infinity; stdlib decides
+    return json.loads(data)
+
+
+def dumpb(
+    obj: Any,
+    indent: bool = True,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """Serialize to UTF-8 JSON bytes, 2-space indented unless ``indent=False``."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    if indent:
+        text = json.dumps(obj, indent=2, default=default, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), default=default, ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def dumps(
+    obj: Any,
+    indent: bool = True,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """Serialize to a JSON string, 2-space indented unless ``indent=False``."""
+    return dumpb(obj, indent=indent, default=default).decode("utf-8")
+
+
+def print_json(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> None:
+    """Write indented JSON and a newline straight to stdout.
+
+    Machine-readable output skips Rich: no markup scan, highlighting or
+    line wrapping, and no intermediate ``str`` when stdout has a buffer.
+    """
+    data = dumpb(obj, default=default) + b"\n"
+    out = sys.stdout
+    out.flush()  # keep ordering with anything already written as text
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        out.write(data.decode("utf-8"))
+        out.flush()
+    else:
+        buffer.write(data)
+        buffer.flush()
@@ -14,10 +14,13 @@ Configuration (for any MCP-compatible agent):
     }
 """
 
-import json
+import asyncio
+import atexit
 import sys
 from typing import Optional
 
+from dasa import jsonio
+
 
 def create_mcp_server():
     """Create and configure the MCP server.
@@ -32,6 +35,11 @@ def create_mcp_server():
 
     server = Server("dasa")
 
+    # Tool calls reuse warm kernels instead of booting one per call
+    from dasa.notebook.kernel_pool import KernelPool
+    pool = KernelPool()
+    atexit.register(pool.shutdown_all)
+
     @server.tool("profile")
     async def profile_tool(notebook: str, var: str) -> str:
         """Profile a variable in the notebook kernel.
@@ -40,18 +48,34 @@ def create_mcp_server():
         Auto-caches the profile to .dasa/profiles/.
         """
         from dasa.notebook.jupyter import JupyterAdapter
-        from dasa.notebook.kernel import DasaKernelManager
+        from dasa.analysis.parser import drop_repeated_imports
         from dasa.analysis.profiler import Profiler
+        from dasa.session.graphs import GraphCache
         from dasa.session.profiles import ProfileCache
         from dasa.session.log import SessionLog
 
         adapter = JupyterAdapter(notebook)
-        kernel = DasaKernelManager()
+        replay_cells = [c for c in adapter.code_cells if c.execution_count is not None]
+        # Only the cells the variable depends on need to run
+        full_replay = None  # set when replay_cells is a slice of it
+        if var.isidentifier():
+            needed = GraphCache().get_or_build(notebook, adapter).cells_for_variable(var)
+            if needed is not None:
+                needed_set = set(needed)
+                sliced = [c for c in replay_cells if c.index in needed_set]
+                if len(sliced) < len(replay_cells):
+                    full_replay = drop_repeated_imports(replay_cells)
+                    replay_cells = sliced
+        replay_cells = drop_repeated_imports(replay_cells)
+
+        kernel = pool.acquire()
         try:
-            kernel.start()
-            for cell in adapter.code_cells:
-                if cell.execution_count is not None:
-                    kernel.execute(cell.source, timeout=60)
+            replayed = kernel.execute_many([c.source for c in replay_cells], timeout=60)
+            if full_replay is not None and not all(r.success for r in replayed):
+                # The slice missed something: replay everything on a clean kernel
+                sliced_kernel, kernel = kernel, pool.acquire()
+                pool.release(sliced_kernel)
+                kernel.execute_many([c.source for c in full_replay], timeout=60)
 
             profiler = Profiler(kernel)
             df_profile = profiler.profile_dataframe(var)
@@ -62,9 +86,9 @@ def create_mcp_server():
             log = SessionLog()
             log.append("profile", f"Profiled {var}. {df_profile.shape[0]:,} rows x {df_profile.shape[1]} cols.")
 
-            return json.dumps(df_profile.to_dict(), indent=2)
+            return jsonio.dumps(df_profile.to_dict(), indent=False)
         finally:
-            kernel.shutdown()
+            pool.release(kernel)
 
     @server.tool("check")
     async def check_tool(notebook: str, cell: Optional[int] = None) -> str:
@@ -74,12 +98,17 @@ def create_mcp_server():
         """
         from dasa.notebook.jupyter import JupyterAdapter
         from dasa.analysis.state import StateAnalyzer
-        from dasa.analysis.deps import DependencyAnalyzer
+        from dasa.analysis.parser import parse_cells
+        from dasa.session.graphs import GraphCache
         from dasa.session.log import SessionLog
 
         adapter = JupyterAdapter(notebook)
-        state_analysis = StateAnalyzer().analyze(adapter)
-        dep_graph = DependencyAnalyzer().build_graph(adapter)
+        parsed = parse_cells(adapter.code_cells)
+        # Off the event loop; the graph cache's file I/O overlaps the state pass
+        state_analysis, dep_graph = await asyncio.gather(
+            asyncio.to_thread(StateAnalyzer().analyze, adapter, parsed=parsed),
+            asyncio.to_thread(GraphCache().get_or_build, notebook, adapter, parsed=parsed),
+        )
 
         result = {
             "notebook": notebook,
@@ -97,7 +126,7 @@ def create_mcp_server():
         issue_count = len(state_analysis.issues)
         log.append("check", f"{'Found ' + str(issue_count) + ' issues' if issue_count else 'Consistent'} in {notebook}")
 
-        return json.dumps(result, indent=2)
+        return jsonio.dumps(result, indent=False)
 
     @server.tool("run")
     async def run_tool(notebook: str, cell: Optional[int] = None, all_cells: bool = False) -> str:
@@ -106,8 +135,8 @@ def create_mcp_server():
         Returns output or error with available columns/variables and suggestions.
         """
         from dasa.notebook.jupyter import JupyterAdapter
-        from dasa.notebook.kernel import DasaKernelManager
         from dasa.analysis.error_context import build_error_context
+        from dasa.analysis.parser import drop_repeated_imports
         from dasa.session.log import SessionLog
         from dasa.session.state import StateTracker
 
@@ -121,23 +150,25 @@ def create_mcp_server():
         else:
             targets = code_cells
 
-        kernel = DasaKernelManager()
         log = SessionLog()
         state_tracker = StateTracker()
         results = []
+        executed: list[tuple[int, str]] = []
 
+        kernel = pool.acquire()
         try:
-            kernel.start()
             if cell is not None:
                 first_target = cell
-                for c in code_cells:
-                    if c.index < first_target and c.execution_count is not None:
-                        kernel.execute(c.source, timeout=300)
+                replay_cells = drop_repeated_imports([
+                    c for c in code_cells
+                    if c.index < first_target and c.execution_count is not None
+                ])
+                kernel.execute_many([c.source for c in replay_cells], timeout=300)
 
             for target in targets:
                 result = kernel.execute(target.source, timeout=300)
                 if result.success:
-                    state_tracker.update_cell(notebook, target.index, target.source)
+                    executed.append((target.index, target.source))
                     log.append("run", f"Cell {target.index} executed (success)")
                     results.append({"cell": target.index, "success": True, "stdout": result.stdout})
                 else:
@@ -148,9 +179,13 @@ def create_mcp_server():
                     log.append("run", f"Cell {target.index} failed: {result.error_type}: {result.error}")
                     results.append({"cell": target.index, "success": False, "error": error_ctx})
         finally:
-            kernel.shutdown()
+            # Persist before the (up to 10s) reset; teardown errors can't lose it
+            try:
+                state_tracker.update_cells(notebook, executed)
+            finally:
+                pool.release(kernel)
 
-        return json.dumps(results, indent=2)
+        return jsonio.dumps(results, indent=False)
 
     @server.tool("context")
     async def context_tool(
@@ -176,22 +211,22 @@ def create_mcp_server():
             if goal or status:
                 ctx_mgr.ensure_session()
                 ctx_mgr.update(goal=goal, status=status)
-                if goal:
-                    session_log.append("user", f"Goal: {goal}")
-                if status:
-                    session_log.append("user", f"Status: {status}")
+            entries = []
+            if goal:
+                entries.append(("user", f"Goal: {goal}"))
+            if status:
+                entries.append(("user", f"Status: {status}"))
             if log_msg:
                 ctx_mgr.ensure_session()
-                session_log.append("agent", log_msg)
-            return json.dumps({"status": "updated"})
+                entries.append(("agent", log_msg))
+            session_log.append_many(entries)
+            return jsonio.dumps({"status": "updated"}, indent=False)
 
         # Read
         ctx = ctx_mgr.read()
-        profiles = {}
-        for name in profile_cache.list_profiles():
-            profiles[name] = profile_cache.load(name)
+        profiles = profile_cache.load_all()
 
-        return json.dumps({
+        return jsonio.dumps({
             "project": {
                 "name": ctx.name,
                 "goal": ctx.goal,
@@ -202,7 +237,7 @@ def create_mcp_server():
             "approaches": ctx.approaches,
             "profiles": profiles,
             "recent_log": session_log.read(last_n=20),
-        }, indent=2, default=str)
+        }, indent=False, default=str)
 
     return server
 
@@ -214,7 +249,6 @@ def run_mcp_server():
         print("Error: MCP package not installed. Install with: pip install mcp", file=sys.stderr)
         sys.exit(1)
 
-    import asyncio
     from mcp.server.stdio import stdio_server
 
     async def main():
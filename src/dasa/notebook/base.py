@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Cell:
     """Represents a notebook cell."""
     index: int
@@ -30,14 +30,34 @@ class NotebookAdapter(ABC):
 
     @property
     def code_cells(self) -> list[Cell]:
-        """Return only code cells."""
-        return [c for c in self.cells if c.cell_type == "code"]
+        """Return only code cells.
+
+        The filtered list is reused for as long as ``cells`` returns the same
+        list object; adapters hand out a new list whenever cells change.
+        """
+        cells = self.cells
+        cached = getattr(self, "_code_cells_cache", None)
+        if cached is not None and cached[0] is cells:
+            return cached[1]
+        code = [c for c in cells if c.cell_type == "code"]
+        self._code_cells_cache = (cells, code)
+        return code
 
     @property
     def execution_order(self) -> list[int]:
-        """Return cell indices sorted by execution order."""
-        executed = [c for c in self.code_cells if c.execution_count is not None]
-        return [c.index for c in sorted(executed, key=lambda c: c.execution_count)]
+        """Return cell indices sorted by execution order.
+
+        The sort is cached alongside ``code_cells`` (same invalidation);
+        each call returns a fresh list.
+        """
+        code = self.code_cells
+        cached = getattr(self, "_execution_order_cache", None)
+        if cached is None or cached[0] is not code:
+            executed = [c for c in code if c.execution_count is not None]
+            order = [c.index for c in sorted(executed, key=lambda c: c.execution_count)]
+            cached = (code, order)
+            self._execution_order_cache = cached
+        return list(cached[1])
 
     @abstractmethod
     def get_cell(self, index: int) -> Cell: ...
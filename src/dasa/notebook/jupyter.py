@@ -1,19 +1,31 @@
 """Jupyter .ipynb adapter using nbformat."""
 
+import os
+import tempfile
 from pathlib import Path
 from typing import Optional
 
 import nbformat
+from nbformat.corpus.words import generate_corpus_id
+from nbformat.reader import get_version
 
+from dasa import jsonio
 from .base import Cell, NotebookAdapter
 
 
 class JupyterAdapter(NotebookAdapter):
-    """Adapter for Jupyter .ipynb notebooks."""
+    """Adapter for Jupyter .ipynb notebooks.
 
-    def __init__(self, path: str | None = None):
+    Loading skips nbformat's schema validation (which only logs problems
+    anyway); pass ``validate=True`` to run it.
+    """
+
+    def __init__(self, path: str | None = None, validate: bool = False):
+        self.validate = validate
         self._nb: Optional[nbformat.NotebookNode] = None
         self._path: Optional[Path] = None
+        # Cell views of self._nb.cells, rebuilt after load() / update_cell()
+        self._cells: Optional[list[Cell]] = None
         if path:
             self.load(path)
 
@@ -23,45 +35,96 @@ class JupyterAdapter(NotebookAdapter):
         if not self._path.exists():
             raise FileNotFoundError(f"Notebook not found: {path}")
         try:
-            with open(self._path) as f:
-                self._nb = nbformat.read(f, as_version=4)
+            # One read of the whole file rather than buffered text-mode reads
+            data = self._path.read_bytes()
+            if self.validate:
+                self._nb = nbformat.reads(data.decode("utf-8"), as_version=4)
+            else:
+                # nbformat.reads minus the schema walk, parsed via jsonio
+                raw = jsonio.loads(data)
+                major, minor = get_version(raw)
+                nb = nbformat.versions[major].to_notebook_json(raw, minor=minor)
+                self._nb = nbformat.convert(nb, 4)
+                _fill_missing_ids(self._nb)
+            self._cells = None
         except Exception as e:
             raise ValueError(f"Failed to read notebook {path}: {e}") from e
 
     def save(self, path: str | None = None) -> None:
-        """Save notebook to path."""
+        """Save notebook to path atomically.
+
+        The file is written in nbformat's usual layout; schema validation
+        is skipped unless the adapter was created with ``validate=True``.
+        """
         save_path = Path(path) if path else self._path
         if save_path is None:
             raise ValueError("No path specified and no path loaded")
-        with open(save_path, "w") as f:
-            nbformat.write(self._nb, f)
+        if self.validate:
+            text = nbformat.writes(self._nb)
+        else:
+            text = nbformat.versions[self._nb.nbformat].writes_json(self._nb)
+        if not text.endswith("\n"):
+            text += "\n"
+
+        # Write through symlinks, and never leave a half-written notebook
+        target = save_path.resolve()
+        fd, tmp_path = tempfile.mkstemp(
+            dir=target.parent, prefix=f".{target.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.chmod(tmp_path, _file_mode(target))
+            os.replace(tmp_path, target)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
 
     @property
     def cells(self) -> list[Cell]:
         """Return all cells."""
         if self._nb is None:
             return []
-        result = []
-        for i, cell in enumerate(self._nb.cells):
-            result.append(Cell(
-                index=i,
-                cell_type=cell.cell_type,
-                source=cell.source,
-                outputs=cell.get("outputs", []),
-                execution_count=cell.get("execution_count"),
-            ))
-        return result
+        if self._cells is None:
+            self._cells = [
+                Cell(
+                    index=i,
+                    cell_type=cell.cell_type,
+                    source=cell.source,
+                    outputs=cell.get("outputs", []),
+                    execution_count=cell.get("execution_count"),
+                )
+                for i, cell in enumerate(self._nb.cells)
+            ]
+        return self._cells
 
-    def get_cell(self, index: int) -> Cell:
-        """Get cell by index."""
+    def _raw_cell(self, index: int) -> nbformat.NotebookNode:
+        """Return the nbformat cell at ``index``, with a helpful error if absent.
+
+        Negative indices are rejected rather than wrapped, so a cell's
+        ``index`` always matches its position.
+        """
         if self._nb is None:
             raise ValueError("No notebook loaded")
-        if index < 0 or index >= len(self._nb.cells):
-            raise IndexError(
-                f"Cell index {index} out of range "
-                f"(notebook has {len(self._nb.cells)} cells, indices 0-{len(self._nb.cells) - 1})"
-            )
-        cell = self._nb.cells[index]
+        cells = self._nb.cells
+        if index >= 0:
+            try:
+                return cells[index]
+            except IndexError:
+                pass
+        n = len(cells)
+        raise IndexError(
+            f"Cell index {index} out of range (notebook has {n} cells, indices 0-{n - 1})"
+        )
+
+    def get_cell(self, index: int) -> Cell:
+        """Get cell by index."""
+        cell = self._raw_cell(index)
+        if self._cells is not None:
+            return self._cells[index]
         return Cell(
             index=index,
             cell_type=cell.cell_type,
@@ -72,21 +135,50 @@ class JupyterAdapter(NotebookAdapter):
 
     def update_cell(self, index: int, source: str) -> None:
         """Update cell source code."""
+        cell = self._raw_cell(index)
+        if cell.source == source:
+            return  # unchanged: keep the cached cell views
+        cell.source = source
+        self._cells = None
+
+    def check_schema(self) -> None:
+        """Validate the notebook against the nbformat schema.
+
+        Raises ``nbformat.ValidationError``. Loads and saves skip this walk
+        unless the adapter was created with ``validate=True``.
+        """
         if self._nb is None:
             raise ValueError("No notebook loaded")
-        if index < 0 or index >= len(self._nb.cells):
-            raise IndexError(
-                f"Cell index {index} out of range "
-                f"(notebook has {len(self._nb.cells)} cells)"
-            )
-        self._nb.cells[index].source = source
+        nbformat.validate(self._nb)
 
     @property
     def raw_notebook(self) -> nbformat.NotebookNode:
-        """Access the raw nbformat notebook object."""
+        """Access the raw nbformat notebook object.
+
+        Cell views are cached; call ``load()`` again after editing it directly.
+        """
         return self._nb
 
     @property
     def path(self) -> Optional[Path]:
         """Return the loaded path."""
         return self._path
+
+
+def _fill_missing_ids(nb: nbformat.NotebookNode) -> None:
+    """Give cells an id where nbformat 4.5+ requires one, as validation would."""
+    if nb.get("nbformat_minor", 0) < 5:
+        return
+    for cell in nb.cells:
+        if "id" not in cell:
+            cell["id"] = generate_corpus_id()
+
+
+def _file_mode(path: Path) -> int:
+    """Permissions for a rewritten file: keep the old ones, else honour umask."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
@@ -3,12 +3,13 @@
 import time
 from collections.abc import Generator
 from dataclasses import dataclass, field
-from typing import Optional, Any
+from typing import TYPE_CHECKING, Optional, Any
 
-from jupyter_client.manager import KernelManager as JupyterKM
+if TYPE_CHECKING:
+    from jupyter_client.manager import KernelManager as JupyterKM
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of executing code in a kernel."""
     success: bool
@@ -21,15 +22,32 @@ class ExecutionResult:
     execution_time: float = 0.0
 
 
+def _elapsed(start_ns: int) -> float:
+    """Seconds since a ``time.perf_counter_ns()`` reading (monotonic)."""
+    return (time.perf_counter_ns() - start_ns) / 1e9
+
+
+def is_noop(code: str) -> bool:
+    """True if ``code`` is empty or only comments, so running it does nothing."""
+    return all(
+        not line or line.startswith("#")
+        for line in (raw.strip() for raw in code.splitlines())
+    )
+
+
 class DasaKernelManager:
     """Start, execute, restart, interrupt Jupyter kernels."""
 
     def __init__(self):
-        self._km: Optional[JupyterKM] = None
+        self._km: Optional["JupyterKM"] = None
         self._kc = None
 
     def start(self, kernel_name: str = "python3") -> None:
         """Start a new kernel."""
+        # Imported here: jupyter_client (zmq, asyncio) is the bulk of CLI
+        # import time and only commands that actually start a kernel need it
+        from jupyter_client.manager import KernelManager as JupyterKM
+
         self._km = JupyterKM(kernel_name=kernel_name)
         self._km.start_kernel()
         self._kc = self._km.client()
@@ -61,8 +79,10 @@ class DasaKernelManager:
         """Execute code in the kernel and return result."""
         if not self._kc:
             raise RuntimeError("Kernel not started. Call start() first.")
+        if is_noop(code):
+            return ExecutionResult(success=True)
 
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         msg_id = self._kc.execute(code)
 
         stdout_parts: list[str] = []
@@ -72,14 +92,18 @@ class DasaKernelManager:
         error_type = None
         tb: list[str] = []
 
+        # Bound once: this loop runs per iopub message (every print() chunk)
+        get_msg = self._kc.get_iopub_msg
+        sinks = {"stdout": stdout_parts.append, "stderr": stderr_parts.append}
+
         while True:
             try:
-                msg = self._kc.get_iopub_msg(timeout=timeout)
+                msg = get_msg(timeout=timeout)
             except Exception:
                 return ExecutionResult(
                     success=False,
                     error="Timeout waiting for kernel response",
-                    execution_time=time.time() - start_time,
+                    execution_time=_elapsed(start_time),
                 )
 
             if msg["parent_header"].get("msg_id") != msg_id:
@@ -89,12 +113,11 @@ class DasaKernelManager:
             content = msg["content"]
 
             if msg_type == "stream":
-                if content["name"] == "stdout":
-                    stdout_parts.append(content["text"])
-                elif content["name"] == "stderr":
-                    stderr_parts.append(content["text"])
+                sink = sinks.get(content["name"])
+                if sink is not None:
+                    sink(content["text"])
             elif msg_type in ("execute_result", "display_data"):
-                result_value = content.get("data", {}).get("text/plain", "")
+                result_value = (content.get("data") or {}).get("text/plain", "")
             elif msg_type == "error":
                 error_type = content.get("ename", "")
                 error = content.get("evalue", "")
@@ -102,7 +125,7 @@ class DasaKernelManager:
             elif msg_type == "status" and content.get("execution_state") == "idle":
                 break
 
-        elapsed = time.time() - start_time
+        elapsed = _elapsed(start_time)
         success = error is None
 
         return ExecutionResult(
@@ -116,6 +139,94 @@ class DasaKernelManager:
             execution_time=elapsed,
         )
 
+    def execute_many(self, codes: list[str], timeout: int = 300) -> list[ExecutionResult]:
+        """Execute several code blocks in order, one result per block.
+
+        All execute requests are sent up front with ``stop_on_error=False``;
+        the kernel still runs them one at a time, in order, and a failing
+        block does not skip the ones after it — the same as calling
+        ``execute`` in a loop, minus one client/kernel round trip per block.
+        """
+        if not self._kc:
+            raise RuntimeError("Kernel not started. Call start() first.")
+        if not codes:
+            return []
+
+        # Empty and comment-only blocks skip the kernel round trip
+        live = [i for i, code in enumerate(codes) if not is_noop(code)]
+        if len(live) < len(codes):
+            results = [ExecutionResult(success=True) for _ in codes]
+            for i, result in zip(live, self.execute_many([codes[i] for i in live], timeout)):
+                results[i] = result
+            return results
+
+        start_time = time.perf_counter_ns()
+        msg_ids = [self._kc.execute(code, stop_on_error=False) for code in codes]
+        slot = {msg_id: i for i, msg_id in enumerate(msg_ids)}
+
+        stdout_parts: list[list[str]] = [[] for _ in codes]
+        stderr_parts: list[list[str]] = [[] for _ in codes]
+        results: list[Optional[ExecutionResult]] = [None] * len(codes)
+        values: list[Any] = [None] * len(codes)
+        errors: list[Optional[tuple[str, str, list[str]]]] = [None] * len(codes)
+        started = [start_time] * len(codes)
+        pending = len(codes)
+
+        get_msg = self._kc.get_iopub_msg
+        sinks = {"stdout": stdout_parts, "stderr": stderr_parts}
+
+        while pending:
+            try:
+                msg = get_msg(timeout=timeout)
+            except Exception:
+                for i, done in enumerate(results):
+                    if done is None:
+                        results[i] = ExecutionResult(
+                            success=False,
+                            error="Timeout waiting for kernel response",
+                            execution_time=_elapsed(started[i]),
+                        )
+                break
+
+            i = slot.get(msg["parent_header"].get("msg_id"))
+            if i is None or results[i] is not None:
+                continue
+
+            msg_type = msg["msg_type"]
+            content = msg["content"]
+
+            if msg_type == "stream":
+                parts = sinks.get(content["name"])
+                if parts is not None:
+                    parts[i].append(content["text"])
+            elif msg_type in ("execute_result", "display_data"):
+                values[i] = (content.get("data") or {}).get("text/plain", "")
+            elif msg_type == "error":
+                errors[i] = (
+                    content.get("ename", ""),
+                    content.get("evalue", ""),
+                    content.get("traceback", []),
+                )
+            elif msg_type == "status":
+                state = content.get("execution_state")
+                if state == "busy":
+                    started[i] = time.perf_counter_ns()
+                elif state == "idle":
+                    error_type, error, tb = errors[i] or (None, None, [])
+                    results[i] = ExecutionResult(
+                        success=errors[i] is None,
+                        stdout="".join(stdout_parts[i]),
+                        stderr="".join(stderr_parts[i]),
+                        result=values[i],
+                        error=error,
+                        error_type=error_type,
+                        traceback=tb,
+                        execution_time=_elapsed(started[i]),
+                    )
+                    pending -= 1
+
+        return results
+
     def execute_streaming(self, code: str, timeout: int = 300) -> Generator[tuple[str, str], None, ExecutionResult]:
         """Execute code and yield (stream_type, text) tuples as output arrives.
 
@@ -124,8 +235,10 @@ class DasaKernelManager:
         """
         if not self._kc:
             raise RuntimeError("Kernel not started. Call start() first.")
+        if is_noop(code):
+            return ExecutionResult(success=True)
 
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         msg_id = self._kc.execute(code)
 
         stdout_parts: list[str] = []
@@ -135,15 +248,18 @@ class DasaKernelManager:
         error_type = None
         tb: list[str] = []
 
+        get_msg = self._kc.get_iopub_msg
+        sinks = {"stdout": stdout_parts.append, "stderr": stderr_parts.append}
+
         while True:
             try:
-                msg = self._kc.get_iopub_msg(timeout=timeout)
+                msg = get_msg(timeout=timeout)
             except Exception:
                 yield ("error", "Timeout waiting for kernel response")
                 return ExecutionResult(
                     success=False,
                     error="Timeout waiting for kernel response",
-                    execution_time=time.time() - start_time,
+                    execution_time=_elapsed(start_time),
                 )
 
             if msg["parent_header"].get("msg_id") != msg_id:
@@ -153,16 +269,14 @@ class DasaKernelManager:
             content = msg["content"]
 
             if msg_type == "stream":
-                if content["name"] == "stdout":
-                    text = content["text"]
-                    stdout_parts.append(text)
-                    yield ("stdout", text)
-                elif content["name"] == "stderr":
+                name = content["name"]
+                sink = sinks.get(name)
+                if sink is not None:
                     text = content["text"]
-                    stderr_parts.append(text)
-                    yield ("stderr", text)
+                    sink(text)
+                    yield (name, text)
             elif msg_type in ("execute_result", "display_data"):
-                result_value = content.get("data", {}).get("text/plain", "")
+                result_value = (content.get("data") or {}).get("text/plain", "")
                 yield ("result", result_value)
             elif msg_type == "error":
                 error_type = content.get("ename", "")
@@ -172,7 +286,7 @@ class DasaKernelManager:
             elif msg_type == "status" and content.get("execution_state") == "idle":
                 break
 
-        elapsed = time.time() - start_time
+        elapsed = _elapsed(start_time)
         success = error is None
 
         return ExecutionResult(
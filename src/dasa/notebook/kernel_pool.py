@@ -0,0 +1,147 @@
+"""Warm kernel reuse for long-lived processes (the MCP server)."""
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from dasa import jsonio
+from dasa.notebook.kernel import DasaKernelManager
+
+# Clears the user namespace; imported modules stay loaded, which is what
+# makes the next acquire cheaper than a cold start. The collect frees
+# reference cycles (DataFrames held by closures, tracebacks) right away
+# instead of whenever the idle kernel next allocates. The trailing ";"
+# keeps the collect count out of Out/_ so the namespace stays empty.
+_RESET_CODE = "get_ipython().reset(new_session=False); __import__('gc').collect();"
+_RESET_TIMEOUT = 10
+
+# Captured once per kernel, right after it starts, so a reset can undo
+# os.chdir / sys.path edits made by the notebook that used it
+_BASELINE_CODE = (
+    "print(__import__('json').dumps("
+    "[__import__('os').getcwd(), __import__('sys').path]))"
+)
+
+
+def _restore_code(cwd: str, path: list[str]) -> str:
+    """Code putting the working directory and ``sys.path`` back to a baseline."""
+    return f"__import__('os').chdir({cwd!r}); __import__('sys').path[:] = {path!r}; "
+
+
+class KernelPool:
+    """Hand out started kernels and keep released ones warm for reuse.
+
+    A released kernel is reset and kept idle (up to ``max_idle``): the
+    user namespace is cleared and the working directory and ``sys.path``
+    go back to what they were when the kernel started. If the reset
+    fails — e.g. the kernel is still busy after a timeout — it is shut
+    down instead. Other process state is *not* reset: imported modules
+    and their settings (pandas options, matplotlib rcParams, random
+    seeds), environment variables and open files carry over to the next
+    caller. Every ``acquire`` gets a kernel of its own, so concurrent
+    callers never share one. Kernels left idle for ``idle_timeout``
+    seconds are shut down to give their memory back.
+    """
+
+    def __init__(
+        self,
+        max_idle: int = 1,
+        kernel_name: str = "python3",
+        idle_timeout: Optional[float] = 300.0,
+    ):
+        self.max_idle = max_idle
+        self.kernel_name = kernel_name
+        self.idle_timeout = idle_timeout
+        # (kernel, monotonic time it became idle), oldest first
+        self._idle: deque[tuple[DasaKernelManager, float]] = deque()
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Timer] = None
+        # kernel -> code restoring its start-up cwd and sys.path
+        self._restore: dict[DasaKernelManager, str] = {}
+
+    def acquire(self) -> DasaKernelManager:
+        """Return a started kernel with an empty namespace."""
+        while True:
+            with self._lock:
+                kernel = self._idle.pop()[0] if self._idle else None
+            if kernel is None:
+                break
+            if kernel.is_alive:
+                return kernel
+            self._discard(kernel)
+
+        kernel = DasaKernelManager()
+        try:
+            kernel.start(self.kernel_name)
+            baseline = kernel.execute(_BASELINE_CODE, timeout=_RESET_TIMEOUT)
+        except BaseException:
+            kernel.shutdown()
+            raise
+        if baseline.success:
+            try:
+                cwd, path = jsonio.loads(baseline.stdout.strip().splitlines()[-1])
+            except (ValueError, TypeError, IndexError):
+                pass
+            else:
+                with self._lock:
+                    self._restore[kernel] = _restore_code(cwd, path)
+        return kernel
+
+    def release(self, kernel: DasaKernelManager) -> None:
+        """Return a kernel to the pool, or shut it down if it can't be reused."""
+        with self._lock:
+            has_room = len(self._idle) < self.max_idle
+        if has_room and kernel.is_alive:
+            with self._lock:
+                restore = self._restore.get(kernel, "")
+            try:
+                reset = kernel.execute(restore + _RESET_CODE, timeout=_RESET_TIMEOUT)
+            except RuntimeError:  # never started
+                reset = None
+            if reset is not None and reset.success:
+                with self._lock:
+                    if len(self._idle) < self.max_idle:
+                        self._idle.append((kernel, time.monotonic()))
+                        self._schedule_reap()
+                        return
+        self._discard(kernel)
+
+    def _discard(self, kernel: DasaKernelManager) -> None:
+        """Shut a kernel down and forget its baseline."""
+        with self._lock:
+            self._restore.pop(kernel, None)
+        kernel.shutdown()
+
+    def _schedule_reap(self) -> None:
+        """Arm the idle reaper if it isn't already. Caller holds the lock."""
+        if self.idle_timeout is None or self._reaper is not None or not self._idle:
+            return
+        # Fire when the oldest idle kernel expires
+        delay = max(0.0, self._idle[0][1] + self.idle_timeout - time.monotonic())
+        self._reaper = threading.Timer(delay, self._reap)
+        self._reaper.daemon = True
+        self._reaper.start()
+
+    def _reap(self) -> None:
+        """Shut down kernels idle for longer than ``idle_timeout``."""
+        expired = []
+        with self._lock:
+            self._reaper = None
+            cutoff = time.monotonic() - self.idle_timeout
+            while self._idle and self._idle[0][1] <= cutoff:
+                expired.append(self._idle.popleft()[0])
+            self._schedule_reap()
+        for kernel in expired:
+            self._discard(kernel)
+
+    def shutdown_all(self) -> None:
+        """Shut down every idle kernel."""
+        with self._lock:
+            idle = [kernel for kernel, _ in self._idle]
+            self._idle.clear()
+            if self._reaper is not None:
+                self._reaper.cancel()
+                self._reaper = None
+        for kernel in idle:
+            self._discard(kernel)
@@ -0,0 +1,62 @@
+"""Cached kernel-derived results (.dasa/cache/).
+
+Results that are only reachable by starting a kernel and replaying cells
+(e.g. the DataFrame listing) are stored under a key derived from exactly
+the cells that were replayed, so repeating a command on an unchanged
+notebook can skip the kernel entirely.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+from dasa import jsonio
+
+
+def replay_key(notebook: str, cells: list[tuple[int, str]]) -> str:
+    """Key for the kernel state produced by running ``cells`` (index, source) in order."""
+    digest = hashlib.sha256(str(Path(notebook).resolve()).encode())
+    for index, source in cells:
+        digest.update(f"\0{index}\0".encode())
+        digest.update(source.encode())
+    return digest.hexdigest()[:16]
+
+
+class ResultCache:
+    """Store JSON-serializable results by kind and replay key."""
+
+    def __init__(self, project_dir: str = ".", session_dir: str | None = None):
+        if session_dir:
+            self.cache_dir = Path(session_dir) / "cache"
+        else:
+            self.cache_dir = Path(project_dir) / ".dasa" / "cache"
+
+    def path_for(self, kind: str, key: str) -> Path:
+        """Return the cache file path for a result."""
+        return self.cache_dir / f"{kind}-{key}.json"
+
+    def load(self, kind: str, key: str) -> Optional[Any]:
+        """Load a cached result. Returns None on missing or corrupted files."""
+        try:
+            return jsonio.loads(self.path_for(kind, key).read_bytes())
+        except (ValueError, OSError):
+            return None
+
+    def save(self, kind: str, key: str, value: Any) -> None:
+        """Save a result atomically. Failures are ignored — it's only a cache."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(jsonio.dumpb(value, indent=False))
+            os.replace(tmp_path, self.path_for(kind, key))
+        except (OSError, TypeError, ValueError):
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
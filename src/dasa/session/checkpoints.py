@@ -0,0 +1,82 @@
+"""Kernel namespace checkpoints (.dasa/checkpoints/).
+
+A checkpoint is a dill snapshot of the kernel's ``__main__`` namespace taken
+after replaying a notebook prefix. Restoring it replaces re-executing those
+cells. Checkpoints are keyed by the exact cell sources they were built
+from, so any edit to the prefix produces a different key.
+"""
+
+import os
+from pathlib import Path
+
+from dasa.session.cache import replay_key
+
+# Executed inside the kernel; dill must be importable there.
+_SAVE_CODE = '''
+import dill as _dasa_dill
+import os as _dasa_os
+(getattr(_dasa_dill, "dump_module", None) or _dasa_dill.dump_session)({tmp!r})
+_dasa_os.replace({tmp!r}, {path!r})
+del _dasa_dill, _dasa_os
+'''
+
+_LOAD_CODE = '''
+import dill as _dasa_dill
+(getattr(_dasa_dill, "load_module", None) or _dasa_dill.load_session)({path!r})
+del _dasa_dill
+'''
+
+
+class CheckpointStore:
+    """Locate and build save/restore code for kernel checkpoints."""
+
+    def __init__(
+        self,
+        project_dir: str = ".",
+        session_dir: str | None = None,
+        keep: int = 3,
+    ):
+        if session_dir:
+            self.checkpoints_dir = Path(session_dir) / "checkpoints"
+        else:
+            self.checkpoints_dir = Path(project_dir) / ".dasa" / "checkpoints"
+        self.keep = keep
+
+    @staticmethod
+    def key_for(notebook: str, cells: list[tuple[int, str]]) -> str:
+        """Key for the state produced by running ``cells`` (index, source) in order."""
+        return replay_key(notebook, cells)
+
+    def path_for(self, key: str) -> Path:
+        """Return the checkpoint file path for a key."""
+        return self.checkpoints_dir / f"{key}.pkl"
+
+    def exists(self, key: str) -> bool:
+        """Check whether a checkpoint has been saved for a key."""
+        return self.path_for(key).exists()
+
+    def save_code(self, key: str) -> str:
+        """Kernel code that snapshots the namespace for ``key`` atomically."""
+        self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(key).resolve()
+        tmp = path.with_suffix(".pkl.tmp")
+        return _SAVE_CODE.format(tmp=str(tmp), path=str(path))
+
+    def load_code(self, key: str) -> str:
+        """Kernel code that restores the namespace saved under ``key``."""
+        return _LOAD_CODE.format(path=str(self.path_for(key).resolve()))
+
+    def prune(self) -> None:
+        """Delete all but the ``keep`` most recently written checkpoints."""
+        if not self.checkpoints_dir.exists():
+            return
+        paths = sorted(
+            self.checkpoints_dir.glob("*.pkl"),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        for stale in paths[self.keep:]:
+            try:
+                os.unlink(stale)
+            except OSError:
+                pass
@@ -8,6 +8,8 @@ from typing import Optional
 import yaml
 from dataclasses import dataclass, field
 
+from dasa import yamlio
+
 
 @dataclass
 class ProjectContext:
@@ -43,7 +45,7 @@ class ContextManager:
 
         try:
             with open(self.context_path) as f:
-                data = yaml.safe_load(f) or {}
+                data = yamlio.load(f) or {}
         except (yaml.YAMLError, OSError) as e:
             print(
                 f"Warning: corrupted {self.context_path}, resetting: {e}",
@@ -87,7 +89,7 @@ class ContextManager:
         )
         try:
             with os.fdopen(fd, "w") as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+                yamlio.dump(data, f)
             os.replace(tmp_path, self.context_path)
         except BaseException:
             try:
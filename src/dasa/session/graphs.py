@@ -0,0 +1,121 @@
+"""Cached dependency graphs (.dasa/graphs/)."""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from dasa import __version__, jsonio
+from dasa.analysis.deps import DependencyAnalyzer, DependencyGraph
+from dasa.analysis.parser import CellAnalysis
+from dasa.notebook.base import NotebookAdapter
+
+
+# In-process layer for long-lived callers (MCP server): (resolved path,
+# mtime_ns, size) -> graph, so an unchanged file skips hashing and disk reads
+_MEMORY_SIZE = 32
+_memory: "OrderedDict[tuple[str, int, int], DependencyGraph]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+# Bumped when graph construction changes within a release, so graphs
+# cached by an older build are rebuilt rather than reused
+_GRAPH_FORMAT = 2
+
+
+def file_digest(path: str) -> str:
+    """Digest of a notebook file's bytes."""
+    return hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+
+
+class GraphCache:
+    """Cache dependency graphs keyed by the notebook's file digest.
+
+    The graph is a pure function of the notebook source (and of the parser,
+    hence the version check), so an unchanged file can reuse it as-is.
+    """
+
+    def __init__(self, project_dir: str = ".", session_dir: str | None = None):
+        if session_dir:
+            self.graphs_dir = Path(session_dir) / "graphs"
+        else:
+            self.graphs_dir = Path(project_dir) / ".dasa" / "graphs"
+
+    def _path_for(self, notebook: str) -> Path:
+        key = hashlib.sha256(str(Path(notebook).resolve()).encode()).hexdigest()[:16]
+        return self.graphs_dir / f"{key}.json"
+
+    def load(self, notebook: str, digest: str) -> Optional[DependencyGraph]:
+        """Return the cached graph if it was built from ``digest``, else None."""
+        try:
+            record = jsonio.loads(self._path_for(notebook).read_bytes())
+        except (ValueError, OSError):
+            return None
+        if (
+            not isinstance(record, dict)
+            or record.get("digest") != digest
+            or record.get("version") != __version__
+            or record.get("format") != _GRAPH_FORMAT
+        ):
+            return None
+        try:
+            return DependencyGraph.from_dict(record["graph"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def get_or_build(
+        self,
+        notebook: str,
+        adapter: NotebookAdapter,
+        parsed: Optional[dict[int, CellAnalysis]] = None,
+    ) -> DependencyGraph:
+        """Return the graph for ``notebook``, building and caching it on a miss.
+
+        Checked in order: this process's memory (by path, mtime and size),
+        the on-disk cache (by content digest), then a fresh build. The
+        returned graph may be shared and must not be modified.
+        """
+        st = os.stat(notebook)
+        mem_key = (str(Path(notebook).resolve()), st.st_mtime_ns, st.st_size)
+        with _memory_lock:
+            graph = _memory.get(mem_key)
+            if graph is not None:
+                _memory.move_to_end(mem_key)
+                return graph
+
+        digest = file_digest(notebook)
+        graph = self.load(notebook, digest)
+        if graph is None:
+            graph = DependencyAnalyzer().build_graph(adapter, parsed=parsed)
+            self.save(notebook, digest, graph)
+
+        with _memory_lock:
+            _memory[mem_key] = graph
+            if len(_memory) > _MEMORY_SIZE:
+                _memory.popitem(last=False)
+        return graph
+
+    def save(self, notebook: str, digest: str, graph: DependencyGraph) -> None:
+        """Save a graph atomically. Failures are ignored — it's only a cache."""
+        record = {
+            "version": __version__,
+            "format": _GRAPH_FORMAT,
+            "digest": digest,
+            "graph": graph.to_dict(),
+        }
+        try:
+            self.graphs_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.graphs_dir, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(jsonio.dumpb(record, indent=False))
+            os.replace(tmp_path, self._path_for(notebook))
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
@@ -1,16 +1,35 @@
 """Async job tracking for background execution."""
 
-import json
 import os
 import signal
 import subprocess
 import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from dasa import jsonio
+
+# Below this many job files, thread start-up costs more than serial reads save
+_PARALLEL_READ_MIN = 8
+_MAX_READ_WORKERS = 16
+
+# Fields whose values repeat across many jobs; interned so listings share one copy
+_INTERNED_FIELDS = ("status", "notebook")
+
+
+def _intern_fields(data) -> None:
+    """Intern repeated string fields of a parsed job dict in place."""
+    if not isinstance(data, dict):
+        return
+    for key in _INTERNED_FIELDS:
+        value = data.get(key)
+        if isinstance(value, str):
+            data[key] = sys.intern(value)
+
 
 @dataclass
 class Job:
@@ -31,6 +50,8 @@ class JobManager:
 
     def __init__(self, project_dir: str = "."):
         self.jobs_dir = Path(project_dir) / ".dasa" / "jobs"
+        # path -> (st_mtime_ns, st_size, parsed data); skips re-parsing unchanged files
+        self._parsed: dict[Path, tuple[int, int, dict]] = {}
 
     def create_job(self, notebook: str, cell: int) -> Job:
         """Create a new job record."""
@@ -63,27 +84,41 @@ class JobManager:
         path = self.jobs_dir / f"{job_id}.json"
         if not path.exists():
             return None
-        with open(path) as f:
-            data = json.load(f)
-        return Job(**data)
+        return self._read_job(path)
 
     def list_jobs(self, status: Optional[str] = None) -> list[Job]:
         """List all jobs, optionally filtered by status."""
         if not self.jobs_dir.exists():
             return []
-        jobs = []
-        for path in sorted(self.jobs_dir.glob("*.json")):
-            with open(path) as f:
-                data = json.load(f)
-            job = Job(**data)
-            if status is None or job.status == status:
-                jobs.append(job)
-        return jobs
+        # scandir + suffix check avoids glob's pattern matching per entry
+        with os.scandir(self.jobs_dir) as entries:
+            paths = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            )
+        if len(paths) >= _PARALLEL_READ_MIN:
+            # File reads release the GIL, so many small reads overlap well
+            workers = min(_MAX_READ_WORKERS, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                loaded = list(pool.map(self._read_job, paths))
+        else:
+            loaded = [self._read_job(path) for path in paths]
+        return [
+            job for job in loaded
+            if job is not None and (status is None or job.status == status)
+        ]
 
     def is_running(self, job_id: str) -> bool:
         """Check if a job's process is still running."""
         job = self.get_job(job_id)
-        if job is None or job.pid == 0:
+        if job is None:
+            return False
+        return self.process_alive(job)
+
+    @staticmethod
+    def process_alive(job: Job) -> bool:
+        """Check if an already-loaded job's process is alive, without re-reading it."""
+        if job.pid == 0:
             return False
         try:
             os.kill(job.pid, 0)
@@ -91,9 +126,31 @@ class JobManager:
         except (ProcessLookupError, PermissionError):
             return False
 
+    def _read_job(self, path: Path) -> Optional[Job]:
+        """Read a job file. Returns None on missing or corrupted files.
+
+        Files whose mtime and size are unchanged since the last read are
+        served from memory instead of being re-read and re-parsed.
+        """
+        try:
+            st = path.stat()
+            cached = self._parsed.get(path)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return Job(**cached[2])
+            data = jsonio.loads(path.read_bytes())
+            _intern_fields(data)
+            job = Job(**data)
+        except FileNotFoundError:
+            self._parsed.pop(path, None)
+            return None
+        except (ValueError, TypeError, OSError) as e:
+            print(f"Warning: corrupted job file {path}, skipping: {e}", file=sys.stderr)
+            return None
+        self._parsed[path] = (st.st_mtime_ns, st.st_size, data)
+        return job
+
     def _save(self, job: Job) -> None:
         """Save job to disk."""
         self.jobs_dir.mkdir(parents=True, exist_ok=True)
         path = self.jobs_dir / f"{job.id}.json"
-        with open(path, "w") as f:
-            json.dump(asdict(job), f, indent=2)
+        path.write_bytes(jsonio.dumpb(asdict(job)))
@@ -1,8 +1,12 @@
 """Append-only decision log (.dasa/log)."""
 
+import os
 from pathlib import Path
 from datetime import datetime
 
+# Bytes read per step when scanning back from the end of the log
+_TAIL_CHUNK = 8192
+
 
 class SessionLog:
     """Append-only log of decisions and actions."""
@@ -15,22 +19,54 @@ class SessionLog:
 
     def append(self, source: str, message: str) -> None:
         """Append an entry to the log."""
+        self.append_many([(source, message)])
+
+    def append_many(self, entries: list[tuple[str, str]]) -> None:
+        """Append several ``(source, message)`` entries with a single write."""
+        if not entries:
+            return
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-        entry = f"{timestamp} [{source}] {message}\n"
+        text = "".join(f"{timestamp} [{source}] {message}\n" for source, message in entries)
 
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.log_path, "a") as f:
-            f.write(entry)
+            f.write(text)
 
     def read(self, last_n: int = 20) -> list[str]:
-        """Read recent log entries."""
-        if not self.log_path.exists():
+        """Read recent log entries.
+
+        Only the end of the file is read, so cost follows ``last_n`` rather
+        than the size of the log.
+        """
+        if last_n <= 0:
+            # lines[-0:] is every line; keep that behaviour
+            return [line.strip() for line in self.read_all().splitlines(keepends=True)]
+        try:
+            f = open(self.log_path, "rb")
+        except FileNotFoundError:
             return []
 
-        with open(self.log_path) as f:
-            lines = f.readlines()
+        with f:
+            pos = f.seek(0, os.SEEK_END)
+            chunks: list[bytes] = []
+            newlines = 0
+            # last_n + 1 newlines guarantee last_n whole lines, even when the
+            # final line is newline-terminated
+            while pos > 0 and newlines <= last_n:
+                step = min(_TAIL_CHUNK, pos)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
 
-        return [line.strip() for line in lines[-last_n:]]
+        data = b"".join(reversed(chunks))
+        if pos > 0:
+            data = data[data.index(b"\n") + 1:]  # drop the partial first line
+        lines = data.split(b"\n")
+        if lines and not lines[-1]:
+            lines.pop()
+        return [line.decode("utf-8", errors="replace").strip() for line in lines[-last_n:]]
 
     def read_all(self) -> str:
         """Read entire log."""
@@ -3,13 +3,20 @@
 import os
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 import yaml
 
+from dasa import jsonio, yamlio
+
 
 class ProfileCache:
-    """Cache and retrieve data profiles."""
+    """Cache and retrieve data profiles.
+
+    Profiles are machine-written, so they are stored as JSON. ``.yaml``
+    files written by earlier versions are still read.
+    """
 
     def __init__(self, project_dir: str = ".", session_dir: str | None = None):
         if session_dir:
@@ -20,15 +27,15 @@ class ProfileCache:
     def save(self, var_name: str, profile: dict) -> Path:
         """Save a profile to cache atomically."""
         self.profiles_dir.mkdir(parents=True, exist_ok=True)
-        path = self.profiles_dir / f"{var_name}.yaml"
+        path = self.profiles_dir / f"{var_name}.json"
 
         fd, tmp_path = tempfile.mkstemp(
             dir=self.profiles_dir,
             suffix=".tmp",
         )
         try:
-            with os.fdopen(fd, "w") as f:
-                yaml.dump(profile, f, default_flow_style=False, sort_keys=False)
+            with os.fdopen(fd, "wb") as f:
+                f.write(jsonio.dumpb(profile))
             os.replace(tmp_path, path)
         except BaseException:
             try:
@@ -37,17 +44,32 @@ class ProfileCache:
                 pass
             raise
 
+        # Drop the legacy copy so it can't shadow or duplicate this one
+        try:
+            (self.profiles_dir / f"{var_name}.yaml").unlink()
+        except FileNotFoundError:
+            pass
+
         return path
 
     def load(self, var_name: str) -> Optional[dict]:
         """Load a cached profile. Returns None on missing or corrupted files."""
+        path = self.profiles_dir / f"{var_name}.json"
+        try:
+            return jsonio.loads(path.read_bytes())
+        except FileNotFoundError:
+            pass
+        except (ValueError, OSError) as e:
+            print(f"Warning: corrupted profile {path}, skipping: {e}", file=sys.stderr)
+            return None
+
         path = self.profiles_dir / f"{var_name}.yaml"
         if not path.exists():
             return None
 
         try:
             with open(path) as f:
-                return yaml.safe_load(f)
+                return yamlio.load(f)
         except (yaml.YAMLError, OSError) as e:
             print(
                 f"Warning: corrupted profile {path}, skipping: {e}",
@@ -57,6 +79,20 @@ class ProfileCache:
 
     def list_profiles(self) -> list[str]:
         """List all cached profile names."""
-        if not self.profiles_dir.exists():
+        # scandir + suffix check: no Path object per entry just to take .stem
+        try:
+            with os.scandir(self.profiles_dir) as entries:
+                files = [entry.name for entry in entries if entry.is_file()]
+        except FileNotFoundError:
             return []
-        return [p.stem for p in self.profiles_dir.glob("*.yaml")]
+        names = [name[:-5] for name in files if name.endswith(".json")]
+        names += [name[:-5] for name in files if name.endswith(".yaml")]
+        return list(dict.fromkeys(names))
+
+    def load_all(self) -> dict[str, Optional[dict]]:
+        """Load every cached profile, reading the files concurrently."""
+        names = self.list_profiles()
+        if len(names) <= 1:
+            return {name: self.load(name) for name in names}
+        with ThreadPoolExecutor(max_workers=min(8, len(names))) as pool:
+            return dict(zip(names, pool.map(self.load, names)))
@@ -1,14 +1,32 @@
 """Staleness tracking via .dasa/state.json."""
 
 import hashlib
-import json
 import os
 import sys
 import tempfile
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+from dasa import jsonio
+
+
+@lru_cache(maxsize=4096)
+def code_hash(source: str) -> str:
+    """Short content hash of cell source, used for staleness detection.
+
+    Memoized: one command typically hashes the same cell several times
+    (state analysis, replay selection, then ``update_cell``).
+    """
+    return hashlib.sha256(source.encode()).hexdigest()[:12]
+
+
+@lru_cache(maxsize=256)
+def _resolve(path: str, cwd: str) -> str:
+    """Resolved form of ``path`` relative to ``cwd``; keyed on cwd so chdir is safe."""
+    return str(Path(cwd, path).resolve())
+
 
 class StateTracker:
     """Track cell code hashes for staleness detection."""
@@ -18,6 +36,8 @@ class StateTracker:
             self.state_path = Path(session_dir) / "state.json"
         else:
             self.state_path = Path(project_dir) / ".dasa" / "state.json"
+        # (st_mtime_ns, st_size, parsed state); skips re-parsing an unchanged file
+        self._parsed: Optional[tuple[int, int, dict]] = None
 
     @staticmethod
     def _normalize_path(path: str) -> str:
@@ -25,21 +45,36 @@ class StateTracker:
 
         Resolves relative paths so './nb.ipynb' and 'nb.ipynb' map to the same key.
         """
-        return str(Path(path).resolve())
+        return _resolve(path, os.getcwd())
 
     def _load(self) -> dict:
-        """Load state from disk. Returns empty dict on missing or corrupted files."""
-        if not self.state_path.exists():
+        """Load state from disk. Returns empty dict on missing or corrupted files.
+
+        The parsed state is kept while the file's mtime and size are
+        unchanged, so repeated calls (one per executed cell) skip the
+        re-read. Callers that modify the result must ``_save`` it.
+        """
+        try:
+            st = self.state_path.stat()
+        except FileNotFoundError:
+            self._parsed = None
             return {}
+        except OSError:
+            st = None
+        if st is not None and self._parsed is not None:
+            if self._parsed[:2] == (st.st_mtime_ns, st.st_size):
+                return self._parsed[2]
         try:
-            with open(self.state_path) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
+            state = jsonio.loads(self.state_path.read_bytes())
+        except (ValueError, OSError) as e:
             print(
                 f"Warning: corrupted {self.state_path}, resetting: {e}",
                 file=sys.stderr,
             )
+            self._parsed = None
             return {}
+        self._parsed = (st.st_mtime_ns, st.st_size, state) if st is not None else None
+        return state
 
     def _save(self, state: dict) -> None:
         """Save state to disk atomically (temp file + rename)."""
@@ -50,63 +85,97 @@ class StateTracker:
             suffix=".tmp",
         )
         try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(state, f, indent=2)
+            # Write straight to the descriptor — no buffered file object
+            data = memoryview(jsonio.dumpb(state))
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
             os.replace(tmp_path, self.state_path)
         except BaseException:
+            self._parsed = None
             try:
                 os.unlink(tmp_path)
             except OSError:
                 pass
             raise
+        try:
+            st = self.state_path.stat()
+        except OSError:
+            self._parsed = None
+        else:
+            self._parsed = (st.st_mtime_ns, st.st_size, state)
 
     def update_cell(self, notebook: str, cell_index: int, source: str) -> None:
         """Update the code hash for a cell after execution."""
+        self.update_cells(notebook, [(cell_index, source)])
+
+    def update_cells(self, notebook: str, cells: list[tuple[int, str]]) -> None:
+        """Update code hashes for several executed cells with one state.json write.
+
+        Cells whose recorded hash already matches are left alone, so re-running
+        unchanged code doesn't rewrite the file; ``last_run`` is when that
+        version of the cell was first run via dasa.
+        """
+        if not cells:
+            return
         state = self._load()
         key = self._normalize_path(notebook)
         if key not in state:
             state[key] = {"cells": {}}
 
-        code_hash = hashlib.sha256(source.encode()).hexdigest()[:12]
-        state[key]["cells"][str(cell_index)] = {
-            "code_hash": code_hash,
-            "last_run": datetime.now().isoformat(),
-        }
-        self._save(state)
+        nb_cells = state[key]["cells"]
+        last_run = datetime.now().isoformat()
+        changed = False
+        for cell_index, source in cells:
+            digest = code_hash(source)
+            recorded = nb_cells.get(str(cell_index))
+            if recorded is not None and recorded.get("code_hash") == digest:
+                continue
+            nb_cells[str(cell_index)] = {"code_hash": digest, "last_run": last_run}
+            changed = True
+        if changed:
+            self._save(state)
+
+    def _cells(self, notebook: str) -> dict:
+        """Recorded ``{str(index): cell state}`` for a notebook (do not modify)."""
+        return self._load().get(self._normalize_path(notebook), {}).get("cells", {})
 
     def is_stale(self, notebook: str, cell_index: int, current_source: str) -> bool:
         """Check if a cell's code has changed since last execution.
 
         Returns True if the cell was never executed via dasa or if its code changed.
         """
-        state = self._load()
-        key = self._normalize_path(notebook)
-        nb_state = state.get(key, {}).get("cells", {})
-        cell_state = nb_state.get(str(cell_index))
+        cell_state = self._cells(notebook).get(str(cell_index))
 
         if cell_state is None:
             return True  # Never executed via dasa
 
-        current_hash = hashlib.sha256(current_source.encode()).hexdigest()[:12]
-        return cell_state["code_hash"] != current_hash
+        return cell_state["code_hash"] != code_hash(current_source)
 
     def was_executed(self, notebook: str, cell_index: int) -> bool:
         """Check if a cell was ever executed via dasa run (regardless of staleness)."""
-        state = self._load()
-        key = self._normalize_path(notebook)
-        nb_state = state.get(key, {}).get("cells", {})
-        return str(cell_index) in nb_state
+        return str(cell_index) in self._cells(notebook)
 
     def was_executed_current(
         self, notebook: str, cell_index: int, current_source: str
     ) -> bool:
         """Check if a cell was executed via dasa and its code hasn't changed since."""
-        return self.was_executed(notebook, cell_index) and not self.is_stale(
-            notebook, cell_index, current_source
-        )
+        # A recorded cell is current exactly when it isn't stale
+        return not self.is_stale(notebook, cell_index, current_source)
+
+    def snapshot(self, notebook: str) -> dict[int, str]:
+        """Return ``{cell_index: code_hash}`` for cells executed via dasa.
+
+        Reads state.json once, so callers checking many cells can compare
+        against :func:`code_hash` instead of re-reading the file per cell.
+        """
+        return {int(idx): cell["code_hash"] for idx, cell in self._cells(notebook).items()}
 
     def get_stale_cells(
         self, notebook: str, cells: list[tuple[int, str]]
     ) -> list[int]:
         """Get indices of cells whose code has changed since last execution."""
-        return [idx for idx, source in cells if self.is_stale(notebook, idx, source)]
+        executed = self.snapshot(notebook)
+        return [idx for idx, source in cells if executed.get(idx) != code_hash(source)]
@@ -0,0 +1,20 @@
+"""YAML load/dump helpers — use libyaml's C loader/dumper when PyYAML has it."""
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
+
+def load(stream: IO | str | bytes) -> Any:
+    """Parse YAML safely. Raises ``yaml.YAMLError`` on bad input."""
+    return yaml.load(stream, Loader=_Loader)
+
+
+def dump(data: Any, stream: IO) -> None:
+    """Write ``data`` as block-style YAML, keeping key order."""
+    yaml.dump(data, stream, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
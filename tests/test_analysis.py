@@ -6,6 +6,7 @@ import tempfile
 from dasa.notebook.jupyter import JupyterAdapter
 from dasa.analysis.state import StateAnalyzer
 from dasa.analysis.deps import DependencyAnalyzer
+from dasa.analysis.parser import parse_cells
 
 
 def _create_notebook(path: str, cells: list[dict]) -> None:
@@ -129,6 +130,20 @@ class TestDependencyAnalyzer:
             assert 1 in downstream
             assert 2 in downstream
 
+    def test_shared_parse_matches(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = f"{tmpdir}/test.ipynb"
+            _create_notebook(path, [
+                {"source": "x = 1", "execution_count": 1},
+                {"source": "y = x + z", "execution_count": 2},
+            ])
+            adapter = JupyterAdapter(path)
+            parsed = parse_cells(adapter.code_cells)
+            graph = DependencyAnalyzer().build_graph(adapter, parsed=parsed)
+            assert graph.to_dict() == DependencyAnalyzer().build_graph(adapter).to_dict()
+            analysis = StateAnalyzer().analyze(adapter, parsed=parsed)
+            assert analysis.undefined_refs == [(1, "z")]
+
     def test_no_deps(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             path = f"{tmpdir}/test.ipynb"
@@ -156,3 +171,59 @@ class TestDependencyAnalyzer:
             assert 0 in d
             assert 1 in d
             assert "downstream" in d[0]
+
+    def test_deep_chain_has_no_recursion_limit(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = f"{tmpdir}/test.ipynb"
+            n = 1500
+            cells = [{"source": "v0 = 0", "execution_count": 1}]
+            cells += [
+                {"source": f"v{i} = v{i - 1} + 1", "execution_count": i + 1}
+                for i in range(1, n)
+            ]
+            _create_notebook(path, cells)
+            graph = DependencyAnalyzer().build_graph(JupyterAdapter(path))
+            assert graph.get_downstream(0) == list(range(1, n))
+            assert graph.get_upstream(n - 1) == list(range(n - 1))
+
+    def test_cells_for_variable(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = f"{tmpdir}/test.ipynb"
+            _create_notebook(path, [
+                {"source": "import pandas as pd", "execution_count": 1},
+                {"source": "other = 1", "execution_count": 2},
+                {"source": "df = pd.DataFrame()", "execution_count": 3},
+                {"source": "unrelated = other + 1", "execution_count": 4},
+                {"source": "df['x'] = other", "execution_count": 5},
+            ])
+            graph = DependencyAnalyzer().build_graph(JupyterAdapter(path))
+            assert graph.cells_for_variable("df") == [0, 1, 2, 4]
+            assert graph.cells_for_variable("missing") is None
+
+    def test_cells_for_variable_follows_rebinding(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = f"{tmpdir}/test.ipynb"
+            _create_notebook(path, [
+                {"source": "import pandas as pd", "execution_count": 1},
+                {"source": "df = pd.DataFrame({'a': [1, None]})", "execution_count": 2},
+                {"source": "df = df.dropna()", "execution_count": 3},
+                {"source": "x = 1", "execution_count": 4},
+                {"source": "x += 1", "execution_count": 5},
+            ])
+            graph = DependencyAnalyzer().build_graph(JupyterAdapter(path))
+            assert graph.cells_for_variable("df") == [0, 1, 2]
+            assert graph.cells_for_variable("x") == [3, 4]
+            assert graph.get_downstream(1) == [2]
+
+    def test_cells_for_variable_keeps_side_effects(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = f"{tmpdir}/test.ipynb"
+            _create_notebook(path, [
+                {"source": "import os\nimport pandas as pd", "execution_count": 1},
+                {"source": "os.chdir('data')", "execution_count": 2},
+                {"source": "model.fit(X, y)", "execution_count": 3},
+                {"source": "df = pd.read_csv('a.csv')", "execution_count": 4},
+                {"source": "pd.set_option('display.width', 200)", "execution_count": 5},
+            ])
+            graph = DependencyAnalyzer().build_graph(JupyterAdapter(path))
+            assert graph.cells_for_variable("df") == [0, 1, 3]
@@ -38,6 +38,35 @@ class TestStateTracker:
             assert 1 in stale     # changed
             assert 2 in stale     # never run
 
+    def test_update_cells(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = StateTracker(tmpdir)
+            tracker.update_cells("test.ipynb", [])
+            assert not tracker.state_path.exists()
+            tracker.update_cells("test.ipynb", [(0, "x = 1"), (2, "y = x")])
+            cells = [(0, "x = 1"), (1, "z = 0"), (2, "y = x")]
+            assert tracker.get_stale_cells("test.ipynb", cells) == [1]
+
+    def test_unchanged_cells_skip_write(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = StateTracker(tmpdir)
+            tracker.update_cell("test.ipynb", 0, "x = 1")
+            inode = tracker.state_path.stat().st_ino  # saves replace the file
+            tracker.update_cell("test.ipynb", 0, "x = 1")
+            assert tracker.state_path.stat().st_ino == inode
+            tracker.update_cell("test.ipynb", 0, "x = 2")
+            assert tracker.state_path.stat().st_ino != inode
+            assert tracker.is_stale("test.ipynb", 0, "x = 1")
+
+    def test_cached_state_tracks_other_writers(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = StateTracker(tmpdir)
+            tracker.update_cell("test.ipynb", 0, "x = 1")
+            assert tracker._load() is tracker._load()
+
+            StateTracker(tmpdir).update_cell("test.ipynb", 1, "y = 2")
+            assert tracker.snapshot("test.ipynb").keys() == {0, 1}
+
 
 class TestErrorContext:
     def test_fuzzy_match(self):
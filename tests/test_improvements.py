@@ -199,3 +199,18 @@ class TestProfileRoundtrip:
         assert d["shape"] == [2, 2]
         assert "a" in d["columns"]
         assert "b" in d["columns"]
+
+    def test_parse_profile_from_raw_data(self):
+        data = {
+            "name": "df",
+            "shape": [3, 1],
+            "memory_bytes": 24,
+            "columns": [{
+                "name": "a", "dtype": "float64", "non_null_count": 2,
+                "total_count": 3, "null_count": 1, "null_percent": 33.33,
+                "unique_count": 2, "min_val": -1.0, "max_val": 2.0,
+            }],
+        }
+        profile = Profiler.parse_profile(data)
+        assert profile.shape == (3, 1)
+        assert profile.columns[0].issues == ["33.33% null values", "has negative values"]
@@ -1,5 +1,6 @@
 """Tests for job tracking."""
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -60,3 +61,55 @@ class TestJobManager:
         with tempfile.TemporaryDirectory() as tmpdir:
             mgr = JobManager(tmpdir)
             assert mgr.list_jobs() == []
+
+    def test_list_many_jobs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mgr = JobManager(tmpdir)
+            created = [mgr.create_job("a.ipynb", i) for i in range(20)]
+            jobs = mgr.list_jobs()
+            assert sorted(j.id for j in jobs) == sorted(j.id for j in created)
+            assert [j.id for j in jobs] == sorted(j.id for j in jobs)
+
+    def test_corrupted_job_skipped(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mgr = JobManager(tmpdir)
+            job = mgr.create_job("a.ipynb", 0)
+            (mgr.jobs_dir / "broken.json").write_text("{not json")
+            jobs = mgr.list_jobs()
+            assert [j.id for j in jobs] == [job.id]
+            assert mgr.get_job("broken") is None
+
+    def test_get_job_sees_external_update(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mgr = JobManager(tmpdir)
+            job = mgr.create_job("a.ipynb", 0)
+            assert mgr.get_job(job.id).status == "running"
+            # Another process (e.g. the background runner) updates the file
+            JobManager(tmpdir).update_job(job.id, status="completed", error="done!")
+            assert mgr.get_job(job.id).status == "completed"
+
+    def test_cached_read_returns_independent_jobs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mgr = JobManager(tmpdir)
+            job = mgr.create_job("a.ipynb", 0)
+            first = mgr.get_job(job.id)
+            first.status = "mutated"
+            assert mgr.get_job(job.id).status == "running"
+
+    def test_process_alive(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mgr = JobManager(tmpdir)
+            job = mgr.create_job("a.ipynb", 0)
+            assert not mgr.process_alive(job)  # pid not set yet
+            job = mgr.update_job(job.id, pid=os.getpid())
+            assert mgr.process_alive(job)
+            assert mgr.is_running(job.id)
+
+    def test_repeated_fields_share_strings(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mgr = JobManager(tmpdir)
+            for cell in range(3):
+                mgr.create_job("analysis.ipynb", cell)
+            jobs = JobManager(tmpdir).list_jobs()
+            assert jobs[0].notebook is jobs[1].notebook is jobs[2].notebook
+            assert jobs[0].status is jobs[1].status
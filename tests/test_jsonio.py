@@ -0,0 +1,57 @@
+"""Tests for JSON helpers (orjson with stdlib fallback)."""
+
+import json
+
+import pytest
+
+from dasa import jsonio
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestJsonIO:
+    def test_round_trip(self, backend):
+        data = {"cells": {"0": {"code_hash": "abc"}}, "name": "café"}
+        assert jsonio.loads(jsonio.dumpb(data)) == data
+        assert jsonio.loads(jsonio.dumps(data)) == data
+
+    def test_indent_matches_stdlib(self, backend):
+        data = {"a": [1, 2], "b": {"c": None}}
+        assert jsonio.dumps(data) == json.dumps(data, indent=2)
+
+    def test_compact(self, backend):
+        assert jsonio.dumps({"a": 1, "b": [1, 2]}, indent=False) == '{"a":1,"b":[1,2]}'
+
+    def test_loads_stdlib_nan(self, backend):
+        value = jsonio.loads(json.dumps({"std": float("nan")}))["std"]
+        assert value != value
+
+    def test_loads_invalid(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            jsonio.loads(b"{nope")
+
+    def test_int_keys(self, backend):
+        assert jsonio.loads(jsonio.dumps({1: "x"})) == {"1": "x"}
+
+    def test_default(self, backend):
+        class Thing:
+            def __str__(self):
+                return "thing"
+        assert jsonio.loads(jsonio.dumps({"t": Thing()}, default=str)) == {"t": "thing"}
+
+    def test_invalid_raises_json_error(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            jsonio.loads(b"{not json")
+
+    def test_print_json(self, backend, capsys):
+        jsonio.print_json({"a": [1], "b": "[red]x[/red]"})
+        out = capsys.readouterr().out
+        assert out.endswith("}\n")
+        assert json.loads(out) == {"a": [1], "b": "[red]x[/red]"}
@@ -59,6 +59,13 @@ class TestMarimoAdapter:
             adapter = MarimoAdapter(path)
             assert len(adapter.code_cells) == 3
 
+    def test_dependencies(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = f"{tmpdir}/notebook.py"
+            Path(path).write_text(SAMPLE_MARIMO)
+            adapter = MarimoAdapter(path)
+            assert adapter.dependencies == {0: [], 1: ["df"], 2: ["clean_df"]}
+
     def test_save_raises(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             path = f"{tmpdir}/notebook.py"
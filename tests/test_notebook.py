@@ -4,7 +4,12 @@ import json
 import tempfile
 from pathlib import Path
 
+import nbformat
+import pytest
+
 from dasa.notebook.jupyter import JupyterAdapter
+from dasa.notebook import kernel_pool
+from dasa.notebook.kernel import DasaKernelManager, ExecutionResult, is_noop
 
 
 def _create_test_notebook(path: str, cells: list[dict]) -> None:
@@ -48,6 +53,32 @@ class TestJupyterAdapter:
             assert len(adapter.cells) == 2
             assert adapter.cells[0].source == "x = 1"
 
+    def test_fast_load_matches_validated_load(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = f"{tmpdir}/test.ipynb"
+            _create_test_notebook(path, [
+                {"source": ["x = 1\n", "y = 2"], "execution_count": 1},
+                {"source": "# notes", "cell_type": "markdown"},
+            ])
+            fast = JupyterAdapter(path).raw_notebook
+            validated = JupyterAdapter(path, validate=True).raw_notebook
+            # Missing cell ids are filled in either way (randomly generated)
+            assert all(cell.pop("id") for cell in fast.cells)
+            for cell in validated.cells:
+                del cell["id"]
+            assert fast == validated
+            assert fast.cells[0].source == "x = 1\ny = 2"
+
+    def test_check_schema(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = f"{tmpdir}/test.ipynb"
+            _create_test_notebook(path, [{"source": "x = 1", "execution_count": 1}])
+            adapter = JupyterAdapter(path)
+            adapter.check_schema()
+            adapter.raw_notebook.cells[0]["bogus"] = 1
+            with pytest.raises(nbformat.ValidationError):
+                adapter.check_schema()
+
     def test_code_cells(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             path = f"{tmpdir}/test.ipynb"
@@ -69,6 +100,8 @@ class TestJupyterAdapter:
             adapter = JupyterAdapter(path)
             order = adapter.execution_order
             assert order == [1, 0]  # cell 1 executed first
+            order.append(99)
+            assert adapter.execution_order == [1, 0]
 
     def test_update_cell(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -80,6 +113,22 @@ class TestJupyterAdapter:
             adapter.update_cell(0, "x = 2")
             assert adapter.get_cell(0).source == "x = 2"
 
+    def test_code_cells_refresh_after_update(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = f"{tmpdir}/test.ipynb"
+            _create_test_notebook(path, [
+                {"source": "x = 1", "execution_count": 1},
+                {"source": "# notes", "cell_type": "markdown"},
+            ])
+            adapter = JupyterAdapter(path)
+            assert adapter.code_cells is adapter.code_cells
+            adapter.update_cell(0, "x = 2")
+            assert adapter.code_cells[0].source == "x = 2"
+            assert adapter.cells[0].source == "x = 2"
+            cells = adapter.cells
+            adapter.update_cell(0, "x = 2")
+            assert adapter.cells is cells
+
     def test_save(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             path = f"{tmpdir}/test.ipynb"
@@ -92,3 +141,70 @@ class TestJupyterAdapter:
             # Reload and verify
             adapter2 = JupyterAdapter(path)
             assert adapter2.get_cell(0).source == "x = 2"
+
+    def test_save_matches_nbformat_and_keeps_mode(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "test.ipynb"
+            _create_test_notebook(str(path), [
+                {"source": "x = 1\ny = 2", "execution_count": 1},
+            ])
+            path.chmod(0o640)
+            adapter = JupyterAdapter(str(path))
+            adapter.save()
+            assert path.read_text() == nbformat.writes(adapter.raw_notebook) + "\n"
+            assert path.stat().st_mode & 0o777 == 0o640
+            assert sorted(p.name for p in Path(tmpdir).iterdir()) == ["test.ipynb"]
+
+
+class TestKernelNoop:
+    def test_is_noop(self):
+        assert is_noop("")
+        assert is_noop("  \n\n")
+        assert is_noop("# setup\n   # more notes\n")
+        assert not is_noop("# load\nx = 1")
+        assert not is_noop("%time x")
+
+    def test_noop_blocks_skip_kernel(self):
+        kernel = DasaKernelManager()
+        kernel._kc = object()  # any request to the kernel would fail
+        results = kernel.execute_many(["", "# nothing"])
+        assert [r.success for r in results] == [True, True]
+        assert kernel.execute("  ").success
+
+
+class _FakeKernel:
+    """Stands in for DasaKernelManager; records the code it is sent."""
+
+    def __init__(self):
+        self.sent = []
+        self.is_alive = True
+
+    def start(self, kernel_name="python3"):
+        pass
+
+    def shutdown(self):
+        self.is_alive = False
+
+    def execute(self, code, timeout=300):
+        self.sent.append(code)
+        if code == kernel_pool._BASELINE_CODE:
+            return ExecutionResult(success=True, stdout='["/start", ["/lib"]]\n')
+        return ExecutionResult(success=True)
+
+
+class TestKernelPool:
+    def test_reset_restores_cwd_and_sys_path(self, monkeypatch):
+        monkeypatch.setattr(kernel_pool, "DasaKernelManager", _FakeKernel)
+        pool = kernel_pool.KernelPool(idle_timeout=None)
+        kernel = pool.acquire()
+        pool.release(kernel)
+        reset = kernel.sent[-1]
+        assert "chdir('/start')" in reset
+        assert "path[:] = ['/lib']" in reset
+        assert reset.endswith(kernel_pool._RESET_CODE)
+        assert reset.endswith(";")  # no displayed result left in Out / _
+        assert pool.acquire() is kernel
+        pool.release(kernel)
+        pool.shutdown_all()
+        assert not kernel.is_alive
+        assert pool._restore == {}
@@ -1,6 +1,7 @@
 """Tests for AST parser."""
 
-from dasa.analysis.parser import parse_cell
+from dasa.analysis.parser import drop_repeated_imports, parse_cell
+from dasa.notebook.base import Cell
 
 
 class TestParseCell:
@@ -58,6 +59,16 @@ class TestParseCell:
         assert "x" in result.definitions
         assert "x" not in result.references
 
+    def test_updates(self):
+        assert parse_cell("df = df.dropna()").updates == {"df"}
+        assert parse_cell("x += 1").updates == {"x"}
+        assert parse_cell("x = 1\nprint(x)").updates == set()
+        assert parse_cell("for i in range(3):\n    total = total + i").updates == {"total"}
+
+    def test_top_level_calls(self):
+        assert parse_cell("os.chdir('data')\ndf.head()").calls == {"os", "df"}
+        assert parse_cell("x = pd.set_option('a', 1)").calls == set()
+
     def test_syntax_error_returns_empty(self):
         result = parse_cell("def (invalid")
         assert len(result.definitions) == 0
@@ -67,3 +78,29 @@ class TestParseCell:
         result = parse_cell("x = len([1, 2, 3])")
         assert "len" not in result.references
         assert "x" in result.definitions
+
+    def test_repeated_parse_returns_independent_sets(self):
+        first = parse_cell("y = x + 1")
+        first.definitions.add("z")
+        first.references.clear()
+        second = parse_cell("y = x + 1")
+        assert second.definitions == {"y"}
+        assert second.references == {"x"}
+
+
+class TestDropRepeatedImports:
+    @staticmethod
+    def _kept(*sources):
+        cells = [Cell(index=i, cell_type="code", source=s) for i, s in enumerate(sources)]
+        return [c.index for c in drop_repeated_imports(cells)]
+
+    def test_repeated_import_dropped(self):
+        assert self._kept("import pandas as pd", "x = 1", "import pandas as pd") == [0, 1]
+
+    def test_repeated_non_import_kept(self):
+        assert self._kept("x = 1", "x = 1") == [0, 1]
+
+    def test_rebinding_in_between_keeps_repeat(self):
+        assert self._kept("import pandas as pd", "del pd", "import pandas as pd") == [0, 1, 2]
+        assert self._kept("import numpy as np", "from m import *", "import numpy as np") == [0, 1, 2]
+        assert self._kept("import os", "%reset -f", "import os") == [0, 1, 2]
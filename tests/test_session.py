@@ -1,9 +1,17 @@
 """Tests for session management."""
 
+import os
 import tempfile
 from pathlib import Path
 
+import nbformat
+
+from dasa.analysis.deps import CellNode, DependencyGraph
+from dasa.notebook.jupyter import JupyterAdapter
+from dasa.session.cache import ResultCache, replay_key
+from dasa.session.checkpoints import CheckpointStore
 from dasa.session.context import ContextManager, ProjectContext
+from dasa.session.graphs import GraphCache, file_digest
 from dasa.session.log import SessionLog
 from dasa.session.profiles import ProfileCache
 
@@ -71,6 +79,26 @@ class TestSessionLog:
             assert len(entries) == 3
             assert "message 9" in entries[-1]
 
+    def test_read_tail_of_long_log(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log = SessionLog(tmpdir)
+            (Path(tmpdir) / ".dasa").mkdir()
+            lines = [f"entry {i}" + "x" * (i % 50) for i in range(2000)]
+            log.log_path.write_text("\n".join(lines) + "\n")
+            assert log.read(last_n=5) == lines[-5:]
+            assert log.read(last_n=0) == lines
+
+    def test_append_many(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log = SessionLog(tmpdir)
+            log.append_many([])
+            assert not log.log_path.exists()
+            log.append_many([("user", "Goal: a"), ("agent", "note")])
+            entries = log.read()
+            assert len(entries) == 2
+            assert entries[0].endswith("[user] Goal: a")
+            assert entries[1].endswith("[agent] note")
+
 
 class TestProfileCache:
     def test_save_and_load(self):
@@ -95,3 +123,138 @@ class TestProfileCache:
             profiles = cache.list_profiles()
             assert "df" in profiles
             assert "model" in profiles
+
+    def test_load_all(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ProfileCache(tmpdir)
+            assert cache.load_all() == {}
+            for name in ("a", "b", "c"):
+                cache.save(name, {"name": name})
+            assert cache.load_all() == {n: {"name": n} for n in ("a", "b", "c")}
+
+    def test_reads_legacy_yaml(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ProfileCache(tmpdir)
+            cache.profiles_dir.mkdir(parents=True)
+            legacy = cache.profiles_dir / "df.yaml"
+            legacy.write_text("name: df\nshape:\n- 3\n- 2\n")
+            assert cache.list_profiles() == ["df"]
+            assert cache.load("df") == {"name": "df", "shape": [3, 2]}
+
+            cache.save("df", {"name": "df", "shape": [4, 2]})
+            assert not legacy.exists()
+            assert cache.list_profiles() == ["df"]
+            assert cache.load("df")["shape"] == [4, 2]
+
+    def test_corrupted_json_returns_none(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ProfileCache(tmpdir)
+            cache.profiles_dir.mkdir(parents=True)
+            (cache.profiles_dir / "broken.json").write_text("{not json")
+            assert cache.load("broken") is None
+
+
+class TestCheckpointStore:
+    def test_key_changes_with_source(self):
+        a = CheckpointStore.key_for("nb.ipynb", [(0, "x = 1"), (1, "y = 2")])
+        b = CheckpointStore.key_for("nb.ipynb", [(0, "x = 1"), (1, "y = 3")])
+        assert a != b
+        assert a == CheckpointStore.key_for("./nb.ipynb", [(0, "x = 1"), (1, "y = 2")])
+
+    def test_key_changes_with_index(self):
+        a = CheckpointStore.key_for("nb.ipynb", [(0, "x = 1")])
+        b = CheckpointStore.key_for("nb.ipynb", [(1, "x = 1")])
+        assert a != b
+
+    def test_save_code_targets_store(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = CheckpointStore(tmpdir)
+            code = store.save_code("abc")
+            assert str(store.path_for("abc").resolve()) in code
+            assert store.checkpoints_dir.is_dir()
+            assert not store.exists("abc")
+
+    def test_prune_keeps_most_recent(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = CheckpointStore(tmpdir, keep=2)
+            store.checkpoints_dir.mkdir(parents=True)
+            for i, key in enumerate(["a", "b", "c"]):
+                path = store.path_for(key)
+                path.write_bytes(b"x")
+                os.utime(path, (i, i))
+            store.prune()
+            assert not store.exists("a")
+            assert store.exists("b") and store.exists("c")
+
+
+class TestGraphCache:
+    def _graph(self):
+        graph = DependencyGraph()
+        graph.nodes[0] = CellNode(index=0, definitions={"x"}, downstream={1}, label="x = 1")
+        graph.nodes[1] = CellNode(index=1, references={"x"}, upstream={0}, label="x")
+        return graph
+
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = GraphCache(tmpdir)
+            graph = self._graph()
+            cache.save("nb.ipynb", "d1", graph)
+            loaded = cache.load("nb.ipynb", "d1")
+            assert loaded is not None
+            assert loaded.to_dict() == graph.to_dict()
+            assert loaded.get_downstream(0) == [1]
+
+    def test_digest_mismatch_misses(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = GraphCache(tmpdir)
+            cache.save("nb.ipynb", "d1", self._graph())
+            assert cache.load("nb.ipynb", "d2") is None
+            assert cache.load("other.ipynb", "d1") is None
+
+    def test_get_or_build_reuses_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "nb.ipynb"
+            nb = nbformat.v4.new_notebook()
+            nb.cells = [nbformat.v4.new_code_cell("x = 1"), nbformat.v4.new_code_cell("y = x")]
+            nbformat.write(nb, str(path))
+            cache = GraphCache(tmpdir)
+            first = cache.get_or_build(str(path), JupyterAdapter(str(path)))
+            assert cache.get_or_build(str(path), JupyterAdapter(str(path))) is first
+            assert first.get_downstream(0) == [1]
+
+            nb.cells[1] = nbformat.v4.new_code_cell("y = 2")
+            nbformat.write(nb, str(path))
+            rebuilt = cache.get_or_build(str(path), JupyterAdapter(str(path)))
+            assert rebuilt is not first
+            assert rebuilt.get_downstream(0) == []
+
+    def test_file_digest_tracks_content(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "nb.ipynb"
+            path.write_text("a")
+            first = file_digest(str(path))
+            path.write_text("b")
+            assert file_digest(str(path)) != first
+
+
+class TestResultCache:
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ResultCache(tmpdir)
+            value = [{"name": "df", "shape": [3, 2], "memory_mb": 0.1}]
+            cache.save("dataframes", "k1", value)
+            assert cache.load("dataframes", "k1") == value
+            assert cache.load("dataframes", "k2") is None
+
+    def test_corrupted_returns_none(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ResultCache(tmpdir)
+            cache.cache_dir.mkdir(parents=True)
+            cache.path_for("dataframes", "k1").write_text("{not json")
+            assert cache.load("dataframes", "k1") is None
+
+    def test_replay_key_tracks_cells(self):
+        a = replay_key("nb.ipynb", [(0, "x = 1")])
+        assert a == replay_key("./nb.ipynb", [(0, "x = 1")])
+        assert a != replay_key("nb.ipynb", [(0, "x = 2")])
+        assert a != replay_key("nb.ipynb", [])
@@ -6,7 +6,7 @@ from pathlib import Path
 
 import nbformat
 
-from dasa.session.state import StateTracker
+from dasa.session.state import StateTracker, code_hash
 from dasa.session.context import ContextManager
 from dasa.session.profiles import ProfileCache
 from dasa.analysis.state import StateAnalyzer
@@ -90,6 +90,19 @@ class TestStateTrackerHelpers:
             tracker = StateTracker(tmpdir)
             assert not tracker.was_executed_current("test.ipynb", 0, "x = 1")
 
+    def test_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = StateTracker(tmpdir)
+            tracker.update_cell("test.ipynb", 0, "x = 1")
+            tracker.update_cell("test.ipynb", 2, "y = x")
+            snap = tracker.snapshot("./test.ipynb")
+            assert snap == {0: code_hash("x = 1"), 2: code_hash("y = x")}
+
+    def test_snapshot_empty(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = StateTracker(tmpdir)
+            assert tracker.snapshot("test.ipynb") == {}
+
 
 # ---------------------------------------------------------------------------
 # StateTracker: atomic writes and robust I/O
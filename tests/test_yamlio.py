@@ -0,0 +1,21 @@
+"""Tests for YAML helpers (libyaml with pure-Python fallback)."""
+
+import io
+
+import pytest
+import yaml
+
+from dasa import yamlio
+
+
+class TestYamlIO:
+    def test_matches_pyyaml_output(self):
+        data = {"project": {"name": "x", "constraints": ["a", "b"]}, "approaches": [], "data": {}}
+        out = io.StringIO()
+        yamlio.dump(data, out)
+        assert out.getvalue() == yaml.dump(data, default_flow_style=False, sort_keys=False)
+        assert yamlio.load(out.getvalue()) == data
+
+    def test_load_is_safe(self):
+        with pytest.raises(yaml.YAMLError):
+            yamlio.load("!!python/object/apply:os.getcwd []")